@@ -24,19 +24,22 @@ Implementation Notes
 
 """
 
+import array
 from sys import implementation
 
 from adafruit_bus_device import i2c_device
 from adafruit_register.i2c_bit import RWBit
 from adafruit_register.i2c_struct import ROUnaryStruct, UnaryStruct
 
+from .pixel_map import UNUSED, PixelMap, apply_permutation, compile_map
+
 try:
     # Used only for typing
-    from typing import Optional, Tuple, Union
+    from typing import Callable, Optional, Sequence, Tuple, Union
 
     import busio
     from adafruit_framebuf import FrameBuffer
-    from circuitpython_typing import ReadableBuffer
+    from circuitpython_typing import ReadableBuffer, WriteableBuffer
     from circuitpython_typing.pil import Image
 except ImportError:
     pass
@@ -60,6 +63,7 @@ _IS3741_FUNCREG_RESET = 0x3F
 NO_BUFFER = 0x00  # DO NOT buffer pixel data, write pixels as needed
 PREFER_BUFFER = 0x01  # OPTIONALLY buffer pixel data, RAM permitting
 MUST_BUFFER = 0x02  # MUST buffer pixel data, else throw MemoryError
+CACHE_BUFFER = 0x03  # Write pixels as needed, cache a few recent values
 
 
 class IS31FL3741:
@@ -77,7 +81,12 @@ class IS31FL3741:
                      permitting, buffer pixels in RAM, updating device only
                      when show() is called, but fall back on NO_BUFFER
                      behavior. MUST_BUFFER = buffer pixels in RAM, throw
-                     MemoryError if allocation fails.
+                     MemoryError if allocation fails. CACHE_BUFFER = pixels
+                     are sent to device as they're set (as with NO_BUFFER),
+                     but the most recently written/read values are kept in
+                     a small RAM cache so reading them back skips the bus.
+    :param cache_size: number of LED values held by the CACHE_BUFFER cache;
+                       defaults to 32. Oldest entries are evicted first.
     """
 
     _page_reg = UnaryStruct(_IS3741_COMMANDREGISTER, "<B")
@@ -88,14 +97,16 @@ class IS31FL3741:
     _reset_reg = UnaryStruct(_IS3741_FUNCREG_RESET, "<B")
     _shutdown_bit = RWBit(_IS3741_FUNCREG_CONFIG, 0)
     _pixel_buffer = None
+    _cache_index = None
 
     def __init__(
         self,
         i2c: busio.I2C,
         address: int = _IS3741_ADDR_DEFAULT,
         allocate: int = NO_BUFFER,
+        cache_size: int = 32,
     ):
-        if allocate >= PREFER_BUFFER:
+        if allocate in {PREFER_BUFFER, MUST_BUFFER}:
             try:
                 # Pixel buffer intentionally has an extra item at the start
                 # (value of 0) so we can i2c.write() from the buffer directly
@@ -105,6 +116,19 @@ class IS31FL3741:
             except MemoryError:
                 if allocate == MUST_BUFFER:
                     raise
+        elif allocate == CACHE_BUFFER:
+            if not 0 < cache_size < 351:
+                raise ValueError("Cache size must be 1 ~ 350")
+            # Cache is a fixed ring of slots: _cache_leds holds the LED index
+            # in each slot (-1 if empty), _cache_values its PWM value, and
+            # _cache_index maps LED index to slot for constant-time lookup.
+            # Slots are reused in FIFO order.
+            self._cache_leds = array.array("h", [-1] * cache_size)
+            self._cache_values = bytearray(cache_size)
+            self._cache_index = {}
+            self._cache_next = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
         self.i2c_device = i2c_device.I2CDevice(i2c, address)
         if self._id_reg != 2 * address:
             raise AttributeError("Cannot find a IS31FL3741 at address 0x", address)
@@ -116,6 +140,26 @@ class IS31FL3741:
         """Reset"""
         self.page = 4
         self._reset_reg = 0xAE
+        if self._cache_index is not None:
+            # All PWM registers are zero after reset; cached values are stale
+            self._cache_index = {}
+            for slot in range(len(self._cache_leds)):
+                self._cache_leds[slot] = -1
+            self._cache_next = 0
+
+    def _cache_store(self, led: int, pwm: int) -> None:
+        """Record an LED's PWM value in the CACHE_BUFFER cache, evicting the
+        oldest entry if the cache is full."""
+        slot = self._cache_index.get(led)
+        if slot is None:
+            slot = self._cache_next
+            evicted = self._cache_leds[slot]
+            if evicted >= 0:
+                del self._cache_index[evicted]
+            self._cache_leds[slot] = led
+            self._cache_index[led] = slot
+            self._cache_next = (slot + 1) % len(self._cache_values)
+        self._cache_values[slot] = pwm
 
     def unlock(self) -> None:
         """Unlock"""
@@ -135,6 +179,20 @@ class IS31FL3741:
         with self.i2c_device as i2c:
             i2c.write(scalebuf, end=172)  # 2nd page is smaller
 
+    def _write_scaling_span(self, start: int, buffer: WriteableBuffer) -> None:
+        """Set scaling for consecutive LEDs starting at start in one write.
+        buffer[0] is overwritten with the register address; the levels
+        follow it. The span must not cross the page 2/3 boundary (LED 180).
+        """
+        if start < 180:
+            self.page = 2
+            buffer[0] = start
+        else:
+            self.page = 3
+            buffer[0] = start - 180
+        with self.i2c_device as i2c:
+            i2c.write(buffer)
+
     @property
     def global_current(self) -> int:
         """Global current"""
@@ -177,6 +235,12 @@ class IS31FL3741:
             raise ValueError("LED must be 0 ~ 350")
         if self._pixel_buffer:
             return self._pixel_buffer[1 + led]
+        if self._cache_index is not None:
+            slot = self._cache_index.get(led)
+            if slot is not None:
+                self.cache_hits += 1
+                return self._cache_values[slot]
+            self.cache_misses += 1
         if led < 180:
             self.page = 0
             self._buf[0] = led
@@ -188,6 +252,8 @@ class IS31FL3741:
             i2c.write_then_readinto(
                 self._buf, self._buf, out_start=0, out_end=1, in_start=1, in_end=2
             )
+        if self._cache_index is not None:
+            self._cache_store(led, self._buf[1])
         return self._buf[1]
 
     def __setitem__(self, led: int, pwm: int) -> None:
@@ -207,6 +273,8 @@ class IS31FL3741:
                 self._buf[1] = pwm
                 with self.i2c_device as i2c:
                     i2c.write(self._buf)
+                if self._cache_index is not None:
+                    self._cache_store(led, pwm)
             else:
                 raise ValueError("PWM must be 0 ~ 255")
         else:
@@ -217,24 +285,33 @@ class IS31FL3741:
         unbuffered.
         """
         if self._pixel_buffer:
+            self._write_span(0, 180)
+            self._write_span(180, 351)
+
+    def _write_span(self, start: int, end: int) -> None:
+        """Issue buffered pixel data for LEDs start through end-1 to device.
+        The span must not cross the page 0/1 boundary (LED 180).
+        """
+        if start < 180:
             self.page = 0
-            with self.i2c_device as i2c:
-                # _pixel_buffer[0] is always 0! (First register addr)
-                i2c.write(self._pixel_buffer, start=0, end=181)
+            reg = start
+        else:
             self.page = 1
-            with self.i2c_device as i2c:
-                # In order to write from pixel buffer directly (without a
-                # whole extra temp buffer), element 180 is saved in a temp var
-                # and replaced with 0 (representing the first regisyer addr on
-                # page 1), then we can i2c.write() directly from that position
-                # in the buffer. Element 180 is restored afterward. This is
-                # the same strategy as used in the Arduino library.
-                # 'end' below is 352 (not 351) because of the extra byte at
-                # the start of the pixel buffer.
-                save = self._pixel_buffer[180]
-                self._pixel_buffer[180] = 0
-                i2c.write(self._pixel_buffer, start=180, end=352)
-                self._pixel_buffer[180] = save
+            reg = start - 180
+        with self.i2c_device as i2c:
+            # In order to write from pixel buffer directly (without a
+            # whole extra temp buffer), the element preceding the span is
+            # saved in a temp var and replaced with the span's first
+            # register addr, then we can i2c.write() directly from that
+            # position in the buffer. The element is restored afterward.
+            # This is the same strategy as used in the Arduino library.
+            # _pixel_buffer[0] is always 0 (first register addr on page 0),
+            # and 'end' is offset by 1 because of that extra byte at the
+            # start of the pixel buffer.
+            save = self._pixel_buffer[start]
+            self._pixel_buffer[start] = reg
+            i2c.write(self._pixel_buffer, start=start, end=end + 1)
+            self._pixel_buffer[start] = save
 
     def write(self, mapping: Tuple, buffer: ReadableBuffer) -> None:
         """
@@ -250,6 +327,17 @@ class IS31FL3741:
         self.show()
 
 
+def _clip(
+    x: int, y: int, width: int, height: int, grid_width: int, grid_height: int
+) -> Tuple[int, int, int, int]:
+    """Clip a width x height source placed at x,y to a grid, returning the
+    source's first visible column and row, and the visible width and height
+    (zero or less if nothing is visible)."""
+    col = max(0, -x)
+    row = max(0, -y)
+    return col, row, min(width, grid_width - x) - col, min(height, grid_height - y) - row
+
+
 IS3741_RGB = (0 << 4) | (1 << 2) | (2)  # Encode as R,G,B
 IS3741_RBG = (0 << 4) | (2 << 2) | (1)  # Encode as R,B,G
 IS3741_GRB = (1 << 4) | (0 << 2) | (2)  # Encode as G,R,B
@@ -257,16 +345,19 @@ IS3741_GBR = (2 << 4) | (0 << 2) | (1)  # Encode as G,B,R
 IS3741_BRG = (1 << 4) | (2 << 2) | (0)  # Encode as B,R,G
 IS3741_BGR = (2 << 4) | (1 << 2) | (0)  # Encode as B,G,R
 
+# Bitmap byte value -> positions (0 = MSB) of its set bits
+_BIT_LUT = tuple(tuple(bit for bit in range(8) if value & (0x80 >> bit)) for value in range(256))
+
 
 class IS31FL3741_colorXY(IS31FL3741):
     """
     Class encompassing IS31FL3741 and a minimal layer for RGB color 2D
     pixel operations (base class is hardware- and register-centric and
     lacks these concepts). Specific boards like the QT matrix or EyeLights
-    glasses then subclass this. In theory, a companion monochrome XY class
-    could be separately implemented in the future if required for anything.
-    Mostly though, this is about providing a place for common RGB matrix
-    functions like fill() that then work across all such devices.
+    glasses then subclass this. The companion IS31FL3741_monoXY class
+    provides the same for single-color LED arrangements. Mostly though,
+    this is about providing a place for common RGB matrix functions like
+    fill() that then work across all such devices.
 
     :param ~adafruit_bus_device.i2c_device i2c_device: the connected i2c bus
            i2c_device
@@ -278,9 +369,12 @@ class IS31FL3741_colorXY(IS31FL3741):
                      permitting, buffer pixels in RAM, updating device only
                      when show() is called, but fall back on NO_BUFFER
                      behavior. MUST_BUFFER = buffer pixels in RAM, throw
-                     MemoryError if allocation fails.
+                     MemoryError if allocation fails. CACHE_BUFFER = sent
+                     as set, with recent values cached, as for IS31FL3741.
     :param order:    Pixel RGB color order, one of the IS3741_* color types
                      above. Default is IS3741_BGR.
+    :param cache_size: number of LED values held by the CACHE_BUFFER cache;
+                       defaults to 32.
     """
 
     def __init__(
@@ -291,14 +385,16 @@ class IS31FL3741_colorXY(IS31FL3741):
         address: int = _IS3741_ADDR_DEFAULT,
         allocate: int = NO_BUFFER,
         order: int = IS3741_BGR,
+        cache_size: int = 32,
     ):
-        super().__init__(i2c, address=address, allocate=allocate)
+        super().__init__(i2c, address=address, allocate=allocate, cache_size=cache_size)
         self.order = order
         self.width = width
         self.height = height
         self.r_offset = (order >> 4) & 3
         self.g_offset = (order >> 2) & 3
         self.b_offset = order & 3
+        self._pixel_map = None
 
     # pylint: enable-msg=too-many-arguments
 
@@ -308,6 +404,14 @@ class IS31FL3741_colorXY(IS31FL3741):
         """Calculate a device-specific LED offset for an X,Y 2D pixel."""
         raise NotImplementedError("Supported in subclasses only")
 
+    @property
+    def pixel_map(self) -> PixelMap:
+        """Precomputed forward/inverse LED tables for this board, compiled
+        from `pixel_addrs` on first use and shared between instances."""
+        if self._pixel_map is None:
+            self._pixel_map = compile_map(self.pixel_addrs, self.width, self.height, self.order)
+        return self._pixel_map
+
     def fill(self, color: int = 0) -> None:
         """Set all pixels to a given RGB color.
 
@@ -316,12 +420,20 @@ class IS31FL3741_colorXY(IS31FL3741):
         red = (color >> 16) & 0xFF
         green = (color >> 8) & 0xFF
         blue = color & 0xFF
-        for y in range(self.height):
-            for x in range(self.width):
-                addrs = self.pixel_addrs(x, y)
-                self[addrs[self.r_offset]] = red
-                self[addrs[self.g_offset]] = green
-                self[addrs[self.b_offset]] = blue
+        addrs = self.pixel_map.addrs
+        if self._pixel_buffer:
+            buffer = self._pixel_buffer
+            for i in range(0, len(addrs), 3):
+                if addrs[i] != UNUSED:
+                    buffer[addrs[i] + 1] = red
+                    buffer[addrs[i + 1] + 1] = green
+                    buffer[addrs[i + 2] + 1] = blue
+            return
+        for i in range(0, len(addrs), 3):
+            if addrs[i] != UNUSED:  # Skip holes in the mapping
+                self[addrs[i]] = red
+                self[addrs[i + 1]] = green
+                self[addrs[i + 2]] = blue
 
     def pixel(self, x: int, y: int, color: Optional[int] = None) -> Union[int, None]:
         """
@@ -350,6 +462,201 @@ class IS31FL3741_colorXY(IS31FL3741):
                 )
         return None
 
+    def show_region(self, x: int, y: int, width: int, height: int) -> None:
+        """Issue in-RAM pixel data to device for a rectangular area only.
+        The register spans covering each distinct rectangle are computed
+        once and cached, so small areas updated at a high rate (e.g. status
+        icons) only cost the bytes they actually occupy. No effect if pixels
+        are unbuffered.
+
+        :param x:      Left edge of area, in pixels.
+        :param y:      Top edge of area, in pixels.
+        :param width:  Area width in pixels.
+        :param height: Area height in pixels.
+        """
+        if self._pixel_buffer:
+            for start, end in self.pixel_map.region_spans(x, y, width, height):
+                self._write_span(start, end)
+
+    def blit(
+        self,
+        src: ReadableBuffer,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        src_stride: Optional[int] = None,
+        key: Optional[int] = None,
+    ) -> None:
+        """Copy an RGB888 image (e.g. a sprite or icon) to the matrix,
+        clipping to the matrix edges.
+
+        :param src:        Source buffer, 3 bytes (R,G,B) per pixel, row by
+                           row.
+        :param x:          Horizontal position of source's left edge.
+        :param y:          Vertical position of source's top edge.
+        :param width:      Source width in pixels.
+        :param height:     Source height in pixels.
+        :param src_stride: Bytes per source row; default is width * 3.
+        :param key:        Optional packed 24-bit color (0xRRGGBB) treated
+                           as transparent; matching source pixels are
+                           skipped.
+        """
+        if src_stride is None:
+            src_stride = width * 3
+        col, row, vis_width, vis_height = _clip(x, y, width, height, self.width, self.height)
+        addrs = self.pixel_map.addrs
+        buffer = self._pixel_buffer
+        for r in range(row, row + vis_height):
+            src_pos = r * src_stride + col * 3
+            dst_pos = ((y + r) * self.width + x + col) * 3
+            for i in range(0, vis_width * 3, 3):
+                red = src[src_pos + i]
+                green = src[src_pos + i + 1]
+                blue = src[src_pos + i + 2]
+                if key is not None and (red << 16 | green << 8 | blue) == key:
+                    continue
+                red_led = addrs[dst_pos + i]
+                if red_led == UNUSED:
+                    continue
+                if buffer:
+                    buffer[red_led + 1] = red
+                    buffer[addrs[dst_pos + i + 1] + 1] = green
+                    buffer[addrs[dst_pos + i + 2] + 1] = blue
+                else:
+                    self[red_led] = red
+                    self[addrs[dst_pos + i + 1]] = green
+                    self[addrs[dst_pos + i + 2]] = blue
+
+    def draw_bitmap(
+        self,
+        bits: ReadableBuffer,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        fg: int,
+        bg: Optional[int] = None,
+    ) -> None:
+        """Draw a 1-bit bitmap (e.g. a font glyph or icon) in color, clipping
+        to the matrix edges. Each source row is packed MSB-first and padded to
+        a whole byte. Zero bytes are skipped outright, so sparse bitmaps are
+        cheap.
+
+        :param bits:   Source bitmap.
+        :param x:      Horizontal position of bitmap's left edge.
+        :param y:      Vertical position of bitmap's top edge.
+        :param width:  Bitmap width in pixels.
+        :param height: Bitmap height in pixels.
+        :param fg:     Packed 24-bit color (0xRRGGBB) for set bits.
+        :param bg:     Packed 24-bit color for clear bits, or None to leave
+                       those pixels unchanged.
+        """
+        stride = (width + 7) >> 3
+        fg_rgb = ((fg >> 16) & 0xFF, (fg >> 8) & 0xFF, fg & 0xFF)
+        col, row, vis_width, vis_height = _clip(x, y, width, height, self.width, self.height)
+        for r in range(row, row + vis_height):
+            if bg is not None:
+                self.fill_pixels((y + r) * self.width + x + col, vis_width, 1, bg)
+            self._bitmap_row(
+                bits, r * stride, col, col + vis_width, (y + r) * self.width + x, fg_rgb
+            )
+
+    def _bitmap_row(
+        self, bits: ReadableBuffer, src_pos: int, col: int, end: int, dst_pos: int, rgb: Tuple
+    ) -> None:
+        """Expand the set bits of one bitmap row, between source columns col
+        and end-1, into pixels starting at pixel index dst_pos."""
+        addrs = self.pixel_map.addrs
+        buffer = self._pixel_buffer
+        for byte in range(col >> 3, (end + 7) >> 3):
+            for bit in _BIT_LUT[bits[src_pos + byte]]:
+                c = (byte << 3) + bit
+                if col <= c < end:
+                    i = (dst_pos + c) * 3
+                    if addrs[i] != UNUSED:
+                        if buffer:
+                            buffer[addrs[i] + 1] = rgb[0]
+                            buffer[addrs[i + 1] + 1] = rgb[1]
+                            buffer[addrs[i + 2] + 1] = rgb[2]
+                        else:
+                            self[addrs[i]] = rgb[0]
+                            self[addrs[i + 1]] = rgb[1]
+                            self[addrs[i + 2]] = rgb[2]
+
+    def fill_pixels(self, first: int, count: int, step: int, color: int) -> None:
+        """Set a run of pixels to a color: a row segment (step 1), a column
+        segment (step width) or a single pixel. This is the span fill that
+        drawing primitives build on; it does no clipping, so the run must lie
+        within the matrix. Missing pixels in the board's layout are skipped.
+
+        :param first: Index (y * width + x) of the first pixel.
+        :param count: Number of pixels to set.
+        :param step:  Index increment between pixels.
+        :param color: Packed 24-bit color value (0xRRGGBB).
+        """
+        red = (color >> 16) & 0xFF
+        green = (color >> 8) & 0xFF
+        blue = color & 0xFF
+        addrs = self.pixel_map.addrs
+        buffer = self._pixel_buffer
+        for i in range(first * 3, (first + count * step) * 3, step * 3):
+            if addrs[i] != UNUSED:
+                if buffer:
+                    buffer[addrs[i] + 1] = red
+                    buffer[addrs[i + 1] + 1] = green
+                    buffer[addrs[i + 2] + 1] = blue
+                else:
+                    self[addrs[i]] = red
+                    self[addrs[i + 1]] = green
+                    self[addrs[i + 2]] = blue
+
+    def _permute(self, key: Tuple, source: Callable, fill: int = 0) -> None:
+        """Move pixel contents in place through a cached LED permutation."""
+        moves = self.pixel_map.permutation(key, source)
+        target = memoryview(self._pixel_buffer)[1:] if self._pixel_buffer else self
+        apply_permutation(target, moves, ((fill >> 16) & 0xFF, (fill >> 8) & 0xFF, fill & 0xFF))
+
+    def scroll(self, dx: int, dy: int, wrap: bool = False, fill: int = 0) -> None:
+        """Shift the current image on the matrix. Pixels on boards with gaps
+        in their layout (e.g. the LED glasses' nose bridge) can't carry
+        content across the gap, those pixels read as the fill color.
+
+        :param dx:   Pixels to move right (negative for left).
+        :param dy:   Pixels to move down (negative for up).
+        :param wrap: If True, pixels moved off one edge reappear at the
+                     opposite edge; otherwise vacated pixels are filled.
+        :param fill: Packed 24-bit color (0xRRGGBB) for vacated pixels.
+        """
+        width = self.width
+        height = self.height
+        if wrap:
+            dx %= width
+            dy %= height
+
+        def source(x, y):
+            x -= dx
+            y -= dy
+            if wrap:
+                return (x % width, y % height)
+            if 0 <= x < width and 0 <= y < height:
+                return (x, y)
+            return None
+
+        self._permute(("scroll", dx, dy, wrap), source, fill)
+
+    def flip_horizontal(self) -> None:
+        """Mirror the current image on the matrix left-to-right."""
+        self._permute(("flip_h",), lambda x, y: (self.width - 1 - x, y))
+
+    def flip_vertical(self) -> None:
+        """Mirror the current image on the matrix top-to-bottom."""
+        self._permute(("flip_v",), lambda x, y: (x, self.height - 1 - y))
+
+    def rotate_180(self) -> None:
+        """Rotate the current image on the matrix by 180 degrees."""
+        self._permute(("rotate_180",), lambda x, y: (self.width - 1 - x, self.height - 1 - y))
+
     def image(self, img: Union[FrameBuffer, Image]) -> None:
         """Copy an in-memory image to the LED matrix. Image should be in
         24-bit format (e.g. "RGB888") and dimensions should match matrix,
@@ -379,3 +686,158 @@ class IS31FL3741_colorXY(IS31FL3741):
 
     def __len__(self):
         return self.width * self.height * 3
+
+
+class IS31FL3741_monoXY(IS31FL3741):
+    """
+    Class encompassing IS31FL3741 and a minimal layer for single-color 2D
+    pixel operations, treating each LED as one pixel of a grayscale grid.
+    Pixel positions are resolved through a table built once at
+    construction, and bulk operations write straight into the pixel buffer
+    when one is allocated.
+
+    :param ~adafruit_bus_device.i2c_device i2c_device: the connected i2c bus
+           i2c_device
+    :param width:    Grid width in pixels.
+    :param height:   Grid height in pixels.
+    :param mapping:  Optional sequence of width * height LED indices, row by
+                     row, with 65535 marking missing pixels. Default maps
+                     pixel (x,y) to LED y * width + x.
+    :param address: the device address; defaults to 0x30
+    :param allocate: buffer allocation strategy, as for IS31FL3741.
+    :param cache_size: CACHE_BUFFER cache size, as for IS31FL3741.
+    """
+
+    def __init__(
+        self,
+        i2c: busio.I2C,
+        width: int,
+        height: int,
+        mapping: Optional[Sequence[int]] = None,
+        address: int = _IS3741_ADDR_DEFAULT,
+        allocate: int = NO_BUFFER,
+        cache_size: int = 32,
+    ):
+        if mapping is None:
+            if width * height > 351:
+                raise ValueError("Grid larger than 351 LEDs needs a mapping")
+            mapping = range(width * height)
+        elif len(mapping) != width * height:
+            raise ValueError("Mapping must have width * height elements")
+        super().__init__(i2c, address=address, allocate=allocate, cache_size=cache_size)
+        self.width = width
+        self.height = height
+        # LED index + 1, i.e. position in the pixel buffer
+        self._index = array.array("H", (UNUSED if led == UNUSED else led + 1 for led in mapping))
+
+    def pixel_addrs(self, x: int, y: int) -> int:
+        """LED offset for an X,Y 2D pixel, or 65535 if missing."""
+        index = self._index[y * self.width + x]
+        return UNUSED if index == UNUSED else index - 1
+
+    def pixel(self, x: int, y: int, value: Optional[int] = None) -> Union[int, None]:
+        """
+        Set or retrieve brightness of pixel at position (X,Y).
+
+        :param x:     Horizontal pixel position.
+        :param y:     Vertical pixel position.
+        :param value: If setting, brightness from 0 to 255.
+                      If getting, either None or leave off this argument.
+        :returns:     If setting, returns None. If getting, returns
+                      brightness from 0 to 255.
+        """
+        if 0 <= x < self.width and 0 <= y < self.height:  # Clip
+            index = self._index[y * self.width + x]
+            if index != UNUSED:
+                if value is not None:
+                    self[index - 1] = value
+                else:
+                    return self[index - 1]
+        return None
+
+    def fill(self, value: int = 0) -> None:
+        """Set all pixels to a given brightness.
+
+        :param value: Brightness from 0 to 255.
+        """
+        buffer = self._pixel_buffer
+        for index in self._index:
+            if index != UNUSED:
+                if buffer:
+                    buffer[index] = value
+                else:
+                    self[index - 1] = value
+
+    def blit(
+        self,
+        src: ReadableBuffer,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        src_stride: Optional[int] = None,
+    ) -> None:
+        """Copy an 8-bit grayscale image to the grid, one byte per pixel,
+        clipping to the grid edges.
+
+        :param src:    Source buffer, row by row.
+        :param x:      Horizontal position of source's left edge.
+        :param y:      Vertical position of source's top edge.
+        :param width:  Source width in pixels.
+        :param height: Source height in pixels.
+        :param src_stride: Bytes per source row; default is width.
+        """
+        if src_stride is None:
+            src_stride = width
+        col, row, vis_width, vis_height = _clip(x, y, width, height, self.width, self.height)
+        buffer = self._pixel_buffer
+        for r in range(row, row + vis_height):
+            src_pos = r * src_stride + col
+            dst_pos = (y + r) * self.width + x + col
+            for i in range(vis_width):
+                index = self._index[dst_pos + i]
+                if index != UNUSED:
+                    if buffer:
+                        buffer[index] = src[src_pos + i]
+                    else:
+                        self[index - 1] = src[src_pos + i]
+
+    def draw_bitmap(
+        self,
+        bits: ReadableBuffer,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        fg: int,
+        bg: Optional[int] = None,
+    ) -> None:
+        """Draw a 1-bit bitmap to the grid, clipping to the grid edges. Each
+        source row is packed MSB-first and padded to a whole byte.
+
+        :param bits:   Source bitmap.
+        :param x:      Horizontal position of bitmap's left edge.
+        :param y:      Vertical position of bitmap's top edge.
+        :param width:  Bitmap width in pixels.
+        :param height: Bitmap height in pixels.
+        :param fg:     Brightness for set bits, 0 to 255.
+        :param bg:     Brightness for clear bits, 0 to 255, or None to leave
+                       those pixels unchanged.
+        """
+        stride = (width + 7) >> 3
+        col, row, vis_width, vis_height = _clip(x, y, width, height, self.width, self.height)
+        buffer = self._pixel_buffer
+        for r in range(row, row + vis_height):
+            src_pos = r * stride
+            dst_pos = (y + r) * self.width + x
+            for c in range(col, col + vis_width):
+                value = fg if bits[src_pos + (c >> 3)] & (0x80 >> (c & 7)) else bg
+                index = self._index[dst_pos + c]
+                if value is not None and index != UNUSED:
+                    if buffer:
+                        buffer[index] = value
+                    else:
+                        self[index - 1] = value
+
+    def __len__(self):
+        return self.width * self.height
@@ -28,10 +28,11 @@ from struct import unpack_from
 from adafruit_is31fl3741 import _IS3741_ADDR_DEFAULT, IS3741_BGR, MUST_BUFFER, NO_BUFFER
 
 from . import IS31FL3741_colorXY
+from .pixel_map import apply_permutation, compile_map
 
 try:
     # Used only for typing
-    from typing import Any, Tuple
+    from typing import Any, Sequence, Tuple
 
     import busio
 except ImportError:
@@ -50,19 +51,29 @@ class BaseRing:
         self.r_offset = (order >> 4) & 3
         self.g_offset = (order >> 2) & 3
         self.b_offset = order & 3
+        # Order-resolved R,G,B LED indices per ring LED, compiled once and
+        # shared by every ring of the same class and color order
+        self._map = compile_map(self.ledmap_bytes, 24, 1, order)
+        self._addrs = self._map.addrs
 
     def __setitem__(self, led: int, color: int) -> None:
-        offset = self.pixel_addrs(led)
-        self._is31[offset[self.r_offset]] = (color >> 16) & 0xFF
-        self._is31[offset[self.g_offset]] = (color >> 8) & 0xFF
-        self._is31[offset[self.b_offset]] = color & 0xFF
+        if not 0 <= led <= 23:
+            raise ValueError("led must be 0~23")
+        addrs = self._addrs
+        i = led * 3
+        self._is31[addrs[i]] = (color >> 16) & 0xFF
+        self._is31[addrs[i + 1]] = (color >> 8) & 0xFF
+        self._is31[addrs[i + 2]] = color & 0xFF
 
     def __getitem__(self, led: int) -> int:
-        offset = self.pixel_addrs(led)
+        if not 0 <= led <= 23:
+            raise ValueError("led must be 0~23")
+        addrs = self._addrs
+        i = led * 3
         return (
-            (self._is31[offset[self.r_offset]] << 16)
-            | (self._is31[offset[self.g_offset]] << 8)
-            | self._is31[offset[self.b_offset]]
+            (self._is31[addrs[i]] << 16)
+            | (self._is31[addrs[i + 1]] << 8)
+            | self._is31[addrs[i + 2]]
         )
 
     def fill(self, color: int) -> None:
@@ -73,11 +84,48 @@ class BaseRing:
         red = (color >> 16) & 0xFF
         green = (color >> 8) & 0xFF
         blue = color & 0xFF
-        for x in range(24):
-            offset = unpack_from(">HHH", self.ledmap_bytes, x * 6)
-            self._is31[offset[self.r_offset]] = red
-            self._is31[offset[self.g_offset]] = green
-            self._is31[offset[self.b_offset]] = blue
+        addrs = self._addrs
+        buffer = self._is31._pixel_buffer
+        if buffer:
+            for i in range(0, 72, 3):
+                buffer[addrs[i] + 1] = red
+                buffer[addrs[i + 1] + 1] = green
+                buffer[addrs[i + 2] + 1] = blue
+        else:
+            for i in range(0, 72, 3):
+                self._is31[addrs[i]] = red
+                self._is31[addrs[i + 1]] = green
+                self._is31[addrs[i + 2]] = blue
+
+    def set_all(self, colors: Sequence[int]) -> None:
+        """Sets every LED in a ring at once.
+
+        :param colors: 24 packed RGB colors (0xRRGGBB), starting at LED 0.
+        """
+        if len(colors) != 24:
+            raise ValueError("colors must have 24 elements")
+        addrs = self._addrs
+        buffer = self._is31._pixel_buffer
+        target = memoryview(buffer)[1:] if buffer else self._is31
+        for led, color in enumerate(colors):
+            i = led * 3
+            target[addrs[i]] = (color >> 16) & 0xFF
+            target[addrs[i + 1]] = (color >> 8) & 0xFF
+            target[addrs[i + 2]] = color & 0xFF
+
+    def rotate(self, steps: int = 1) -> None:
+        """Rotates the ring's current colors in place, through an LED
+        permutation computed once per distance.
+
+        :param steps: LED positions to move each color by, toward higher
+                      LED numbers; negative moves the other way.
+        """
+        steps %= 24
+        if steps:
+            moves = self._map.permutation(("rotate", steps), lambda x, y: ((x - steps) % 24, 0))
+            buffer = self._is31._pixel_buffer
+            target = memoryview(buffer)[1:] if buffer else self._is31
+            apply_permutation(target, moves, (0, 0, 0))
 
     def pixel_addrs(self, led):
         """
@@ -255,8 +303,11 @@ class LED_Glasses(IS31FL3741_colorXY):
         address: int = _IS3741_ADDR_DEFAULT,
         allocate: int = NO_BUFFER,
         order: int = IS3741_BGR,
+        cache_size: int = 32,
     ):
-        super().__init__(i2c, 18, 5, address=address, allocate=allocate, order=order)
+        super().__init__(
+            i2c, 18, 5, address=address, allocate=allocate, order=order, cache_size=cache_size
+        )
 
         self.set_led_scaling(0xFF)  # turn on LEDs all the way
         self.global_current = 0xFE  # set current to max
@@ -48,8 +48,11 @@ class Adafruit_RGBMatrixQT(IS31FL3741_colorXY):
         address: int = _IS3741_ADDR_DEFAULT,
         allocate: int = NO_BUFFER,
         order: int = IS3741_BGR,
+        cache_size: int = 32,
     ):
-        super().__init__(i2c, 13, 9, address=address, allocate=allocate, order=order)
+        super().__init__(
+            i2c, 13, 9, address=address, allocate=allocate, order=order, cache_size=cache_size
+        )
 
     @staticmethod
     def pixel_addrs(x: int, y: int) -> Tuple[int, int, int]:
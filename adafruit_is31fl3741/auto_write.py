@@ -0,0 +1,111 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_is31fl3741.auto_write`
+====================================================
+
+Coalesced auto-write: instead of transmitting a full frame on every pixel
+assignment, changes mark the frame dirty and it is shown at most once per
+interval. A change after a quiet period is shown at once; changes arriving
+faster than the interval are gathered into the next flush, which happens on
+the next change, `AutoWriter.poll()`, or from the `AutoWriter.run()` task
+under asyncio.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+* `AutoWriter.run()` requires asyncio (the ``asyncio`` library on
+  CircuitPython).
+
+"""
+
+import time
+
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
+
+try:
+    # Used only for typing
+    from typing import Callable
+except ImportError:
+    pass
+
+
+class AutoWriter:
+    """
+    Rate-limits calls to a show function.
+
+    :param show:     Function transmitting the frame, e.g. a display's
+                     ``show``.
+    :param interval: Minimum time between transmissions, in seconds, e.g.
+                     1/60 to cap traffic at 60 frames per second.
+    """
+
+    def __init__(self, show: Callable, interval: float):
+        self._show = show
+        self.interval = interval
+        self.dirty = False
+        self._last = None
+        self._changed = None  # Event waking the run() task
+
+    def mark(self) -> None:
+        """Note that the frame changed. Without a `run()` task, the frame is
+        shown now if the interval has passed since the last transmission."""
+        self.dirty = True
+        if self._changed is not None:
+            self._changed.set()
+        else:
+            self.poll()
+
+    def _wait(self) -> float:
+        """Seconds until the next transmission is allowed."""
+        if self._last is None:
+            return 0
+        return max(0, self._last + self.interval - time.monotonic())
+
+    def poll(self) -> bool:
+        """Show the frame if it changed and the interval has passed. Call
+        regularly from the main loop so the last change of a burst appears.
+
+        :returns: True if the frame was transmitted.
+        """
+        if self.dirty and not self._wait():
+            self.flush()
+            return True
+        return False
+
+    def flush(self) -> None:
+        """Show the frame now if it changed, regardless of the interval."""
+        if self.dirty:
+            self.dirty = False
+            self._last = time.monotonic()
+            self._show()
+
+    async def run(self) -> None:
+        """Task transmitting changes, started with
+        ``asyncio.create_task(writer.run())``. While it runs, changes are
+        only shown from here: at the end of the event loop tick they were
+        made in, or when the interval allows, so changes from several tasks
+        go out together."""
+        self._changed = asyncio.Event()
+        try:
+            while True:
+                if not self.dirty:
+                    await self._changed.wait()
+                self._changed.clear()
+                # Always yields, letting the rest of this tick run first
+                await asyncio.sleep(self._wait())
+                self.flush()
+        finally:
+            self._changed = None
@@ -0,0 +1,132 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_is31fl3741.bdf_glyphs`
+====================================================
+
+Minimal BDF font reader with a glyph cache, for drawing text with
+`IS31FL3741_colorXY.draw_bitmap()`. The font file is indexed once when
+opened; each glyph is decoded on first use and kept, so text redrawn every
+frame (e.g. scrolling) costs no further parsing.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+"""
+
+try:
+    # Used only for typing
+    from typing import Optional, Tuple
+
+    from adafruit_is31fl3741 import IS31FL3741_colorXY
+except ImportError:
+    pass
+
+
+class BDFGlyphCache:
+    """
+    Glyphs of a BDF font, decoded on demand. Each glyph is a tuple of
+    (bits, width, height, x_offset, y_offset, advance), where bits is the
+    MSB-first bitmap, rows padded to a whole byte, as expected by
+    `IS31FL3741_colorXY.draw_bitmap()`.
+
+    :param path: BDF font file name.
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, "rb")
+        self._offsets = {}  # Code point -> file offset of glyph's properties
+        self._glyphs = {}
+        self.ascent = 0
+        bbox_height = bbox_y = 0
+        while True:
+            line = self._file.readline()
+            if not line:
+                break
+            if line.startswith(b"ENCODING "):
+                self._offsets[int(line.split()[1])] = self._file.tell()
+            elif line.startswith(b"FONT_ASCENT "):
+                self.ascent = int(line.split()[1])
+            elif line.startswith(b"FONTBOUNDINGBOX "):
+                _, _, bbox_height, bbox_y = (int(value) for value in line.split()[1:])
+        if not self.ascent:
+            self.ascent = bbox_height + bbox_y
+
+    def close(self) -> None:
+        """Close the font file. Glyphs already decoded remain usable."""
+        self._file.close()
+
+    def glyph(self, char: str) -> Optional[Tuple]:
+        """Get a decoded glyph, or None if the font lacks it.
+
+        :param char: Single character string.
+        """
+        code = ord(char)
+        glyph = self._glyphs.get(code)
+        if glyph is None and code in self._offsets:
+            self._file.seek(self._offsets[code])
+            width = height = x_offset = y_offset = advance = 0
+            while True:
+                line = self._file.readline().strip()
+                if line.startswith(b"DWIDTH "):
+                    advance = int(line.split()[1])
+                elif line.startswith(b"BBX "):
+                    width, height, x_offset, y_offset = (int(value) for value in line.split()[1:])
+                elif line == b"BITMAP":
+                    break
+            bits = bytearray()
+            for _ in range(height):
+                bits.extend(bytes.fromhex(self._file.readline().strip().decode()))
+            glyph = self._glyphs[code] = (bytes(bits), width, height, x_offset, y_offset, advance)
+        return glyph
+
+    def text_width(self, text: str) -> int:
+        """Width in pixels of a string when drawn."""
+        width = 0
+        for char in text:
+            glyph = self.glyph(char)
+            if glyph:
+                width += glyph[5]
+        return width
+
+    def draw(
+        self,
+        display: IS31FL3741_colorXY,
+        text: str,
+        x: int,
+        y: int,
+        fg: int,
+        bg: Optional[int] = None,
+    ) -> int:
+        """Draw a string, clipping to the display edges. Characters missing
+        from the font are skipped.
+
+        :param display: Target color display.
+        :param text:    String to draw.
+        :param x:       Horizontal position of text's left edge.
+        :param y:       Vertical position of text's top (ascent) line.
+        :param fg:      Packed 24-bit color (0xRRGGBB) of the text.
+        :param bg:      Packed 24-bit color filling each glyph's box, or None
+                        to leave background pixels unchanged.
+        :returns:       Horizontal position following the last character.
+        """
+        baseline = y + self.ascent
+        for char in text:
+            glyph = self.glyph(char)
+            if glyph:
+                bits, width, height, x_offset, y_offset, advance = glyph
+                if width and height:
+                    display.draw_bitmap(
+                        bits, x + x_offset, baseline - y_offset - height, width, height, fg, bg
+                    )
+                x += advance
+        return x
@@ -0,0 +1,216 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_is31fl3741.compiled_animation`
+====================================================
+
+Record animations once as device-ordered frames (the 351 PWM bytes as the
+IS31FL3741 receives them) and replay them without recomputing anything.
+Frames after the first are stored as runs of changed bytes, and playback
+copies those runs straight into the pixel buffer.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+"""
+
+from .frame_pacer import FramePacer
+
+try:
+    # Used only for typing
+    from typing import List, Optional, Tuple
+
+    from adafruit_is31fl3741 import IS31FL3741
+except ImportError:
+    pass
+
+# Unchanged bytes between changed runs shorter than this are merged into the
+# run, as a run costs more than a few repeated bytes
+_RUN_GAP = 4
+
+
+def _buffered_device(device: IS31FL3741) -> IS31FL3741:
+    """Resolve the buffered IS31FL3741 behind a display or pixel buffer."""
+    device = getattr(device, "is31fl3741", device)
+    if not getattr(device, "_pixel_buffer", None):
+        raise ValueError("Device must be a buffered adafruit_is31fl3741.IS31FL3741")
+    return device
+
+
+def frame_delta(old: bytes, new: bytes) -> Tuple[Tuple[int, bytes], ...]:
+    """Runs of bytes that differ between two frames.
+
+    :param old: Previous frame.
+    :param new: Next frame, same length.
+    :returns:   Tuple of (start, data) runs; applying them to old gives new.
+    """
+    runs = []
+    start = None
+    last = 0
+    for i in range(len(new)):
+        if old[i] != new[i]:
+            if start is not None and i - last > _RUN_GAP:
+                runs.append((start, bytes(new[start : last + 1])))
+                start = None
+            if start is None:
+                start = i
+            last = i
+    if start is not None:
+        runs.append((start, bytes(new[start : last + 1])))
+    return tuple(runs)
+
+
+class CompiledAnimation:
+    """
+    Recorded frames: the first frame in full, then the changes to reach each
+    following frame, then the changes from the last frame back to the
+    first, for looping.
+
+    :param first:  First frame, 351 bytes.
+    :param deltas: For each following frame and finally the loop back to
+                   the first, a tuple of (start, data) runs as returned by
+                   `frame_delta()`.
+    """
+
+    def __init__(self, first: bytes, deltas: List[Tuple]):
+        self.first = first
+        self.deltas = deltas
+
+    def __len__(self) -> int:
+        return len(self.deltas)  # Deltas include the loop back, not frame 0
+
+    @property
+    def size(self) -> int:
+        """Approximate storage used by frame data, in bytes."""
+        return len(self.first) + sum(len(data) + 2 for delta in self.deltas for _, data in delta)
+
+
+class FrameRecorder:
+    """
+    Captures frames shown on a buffered device.
+
+    :param device: A buffered `adafruit_is31fl3741.IS31FL3741` (or any board
+                   class built on it), or an IS31FL3741_PixelBuf wrapping
+                   one.
+    """
+
+    def __init__(self, device: IS31FL3741):
+        self._device = _buffered_device(device)
+        self._first = None
+        self._last = None
+        self._deltas = []
+
+    def capture(self) -> None:
+        """Record the device's current pixel buffer as the next frame. Call
+        after each ``show()``."""
+        frame = bytes(self._device._pixel_buffer[1:352])
+        if self._first is None:
+            self._first = frame
+        else:
+            self._deltas.append(frame_delta(self._last, frame))
+        self._last = frame
+
+    def finish(self) -> CompiledAnimation:
+        """Finish recording.
+
+        :returns: The recorded frames.
+        """
+        if self._first is None:
+            raise ValueError("No frames captured")
+        self._deltas.append(frame_delta(self._last, self._first))
+        return CompiledAnimation(self._first, self._deltas)
+
+
+class FramePlayer:
+    """
+    Replays a `CompiledAnimation` on a buffered device at a target frame
+    rate.
+
+    :param device:    A buffered `adafruit_is31fl3741.IS31FL3741` (or any
+                      board class built on it), or an IS31FL3741_PixelBuf
+                      wrapping one.
+    :param animation: Frames to play.
+    :param fps:       Target frames per second.
+
+    .. py:attribute:: pacer
+
+        The `adafruit_is31fl3741.frame_pacer.FramePacer` timing `play()`,
+        holding its frame rate and drop statistics.
+    """
+
+    def __init__(
+        self,
+        device: IS31FL3741,
+        animation: CompiledAnimation,
+        fps: float = 30,
+    ):
+        self._device = _buffered_device(device)
+        self.animation = animation
+        self.pacer = FramePacer(self, fps)
+        self._frame = None
+        self._played = 0  # Frames applied since play() started
+        self._last = None  # Last frame play() shows, or None to repeat forever
+
+    @property
+    def fps(self) -> float:
+        """Target frames per second."""
+        return self.pacer.fps
+
+    @fps.setter
+    def fps(self, value: float) -> None:
+        self.pacer.fps = value
+
+    def reset(self) -> None:
+        """Start over from the first frame."""
+        self._frame = None
+
+    def step(self) -> None:
+        """Show the next frame immediately."""
+        self._advance()
+        self._device.show()
+
+    def show(self) -> None:
+        """Show the frame `pacer` is due to show. Frames it skipped to keep
+        up are applied to the pixel buffer but not transmitted. Called by the
+        pacer during `play()`."""
+        target = self.pacer.frame_number
+        if self._last is not None:
+            target = min(target, self._last)
+        while self._played <= target:
+            self._advance()
+            self._played += 1
+        self._device.show()
+
+    def _advance(self) -> None:
+        """Apply the next frame to the pixel buffer."""
+        buffer = self._device._pixel_buffer
+        if self._frame is None:
+            buffer[1:352] = self.animation.first
+            self._frame = 0
+        else:
+            for start, data in self.animation.deltas[self._frame]:
+                buffer[start + 1 : start + 1 + len(data)] = data
+            self._frame = (self._frame + 1) % len(self.animation.deltas)
+
+    def play(self, loops: Optional[int] = 1) -> None:
+        """Play the animation at the target frame rate, paced by `pacer`:
+        when running behind, late frames are skipped.
+
+        :param loops: Number of times to play the animation, or None to
+                      repeat forever.
+        """
+        self.reset()
+        self.pacer.reset()
+        self._played = 0
+        frames = None if loops is None else loops * len(self.animation.deltas)
+        self._last = None if frames is None else frames - 1
+        self.pacer.run(None, frames)
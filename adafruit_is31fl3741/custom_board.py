@@ -0,0 +1,239 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_is31fl3741.custom_board`
+====================================================
+
+CircuitPython driver for custom IS31FL3741 boards described by a mapping
+file rather than a hand-written ``pixel_addrs()`` subclass.
+
+Three mapping file formats are accepted, chosen by file extension:
+
+* ``.json``: ``{"width": 13, "height": 9, "order": "BGR", "pixels": [...]}``
+  where ``pixels`` lists one ``[led, led, led]`` triple (device order) per
+  pixel, row by row, or ``null`` for a missing pixel.
+* ``.csv``: a first line of ``width,height[,order]``, then one
+  ``x,y,led,led,led`` line per pixel. Pixels not listed are missing. Blank
+  lines and lines starting with ``#`` are ignored.
+* anything else: compact binary, as written by `save_mapping()`. A 7-byte
+  header (``b"I3M"``, version, width, height, order) followed by one
+  big-endian 16-bit LED triple per pixel, row by row, 65535 if missing.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+"""
+
+import array
+import json
+from struct import pack, unpack
+
+from adafruit_is31fl3741 import (
+    _IS3741_ADDR_DEFAULT,
+    IS3741_BGR,
+    IS3741_BRG,
+    IS3741_GBR,
+    IS3741_GRB,
+    IS3741_RBG,
+    IS3741_RGB,
+    NO_BUFFER,
+    IS31FL3741_colorXY,
+)
+
+from .pixel_map import UNUSED, compile_map
+
+try:
+    # Used only for typing
+    from typing import Callable, Optional, Tuple, Union
+
+    import busio
+except ImportError:
+    pass
+
+_MAGIC = b"I3M"
+_VERSION = 1
+
+_ORDERS = {
+    "RGB": IS3741_RGB,
+    "RBG": IS3741_RBG,
+    "GRB": IS3741_GRB,
+    "GBR": IS3741_GBR,
+    "BRG": IS3741_BRG,
+    "BGR": IS3741_BGR,
+}
+
+
+def _parse_order(order: Union[int, str]) -> int:
+    if isinstance(order, str):
+        return _ORDERS[order.upper()]
+    return order
+
+
+def load_mapping(path: str) -> Tuple[int, int, int, array.array]:
+    """Read a mapping file.
+
+    :param path: Mapping file name; format is chosen by extension.
+    :returns: (width, height, order, ledmap), where ledmap is an
+              array('H') of device-order LED triples, row by row, with
+              65535 marking missing pixels.
+    """
+    if path.endswith(".json"):
+        with open(path) as file:
+            desc = json.load(file)
+        width = desc["width"]
+        height = desc["height"]
+        order = _parse_order(desc.get("order", IS3741_BGR))
+        if len(desc["pixels"]) != width * height:
+            raise ValueError("Mapping must have width * height pixels")
+        ledmap = array.array("H", [UNUSED] * (width * height * 3))
+        for pos, leds in enumerate(desc["pixels"]):
+            if leds is not None:
+                if len(leds) != 3:
+                    raise ValueError("Each pixel must have 3 LEDs")
+                for i in range(3):
+                    ledmap[pos * 3 + i] = leds[i]
+    elif path.endswith(".csv"):
+        with open(path) as file:
+            ledmap = None
+            for raw_line in file:
+                line = raw_line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                fields = line.split(",")
+                if ledmap is None:
+                    width = int(fields[0])
+                    height = int(fields[1])
+                    order = _parse_order(fields[2].strip()) if len(fields) > 2 else IS3741_BGR
+                    ledmap = array.array("H", [UNUSED] * (width * height * 3))
+                else:
+                    if len(fields) != 5:
+                        raise ValueError("Pixel lines must be x,y,led,led,led")
+                    x = int(fields[0])
+                    y = int(fields[1])
+                    if not (0 <= x < width and 0 <= y < height):
+                        raise ValueError("Pixel must be within width x height")
+                    pos = (y * width + x) * 3
+                    for i in range(3):
+                        ledmap[pos + i] = int(fields[2 + i])
+    else:
+        with open(path, "rb") as file:
+            magic, version, width, height, order = unpack(">3sBBBB", file.read(7))
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError("Not an IS31FL3741 mapping file")
+            data = file.read(width * height * 6)
+        if len(data) != width * height * 6:
+            raise ValueError("Truncated IS31FL3741 mapping file")
+        ledmap = array.array("H", unpack(f">{width * height * 3}H", data))
+    for led in ledmap:
+        if 350 < led != UNUSED:
+            raise ValueError("LED must be 0 ~ 350")
+    return width, height, order, ledmap
+
+
+def save_mapping(
+    path: str, width: int, height: int, pixel_addrs: Callable, order: int = IS3741_BGR
+) -> None:
+    """Write a compact binary mapping file from an existing ``pixel_addrs()``
+    function, e.g. to precompute a board whose mapping is costly to
+    calculate.
+
+    :param path:   Output file name.
+    :param width:  Matrix width in pixels.
+    :param height: Matrix height in pixels.
+    :param pixel_addrs: Function returning the 3 device-order LED indices of
+                   pixel (x,y), or None for a missing pixel.
+    :param order:  Pixel RGB color order, one of the IS3741_* color types.
+    """
+    with open(path, "wb") as file:
+        file.write(pack(">3sBBBB", _MAGIC, _VERSION, width, height, order))
+        for y in range(height):
+            for x in range(width):
+                file.write(pack(">HHH", *(pixel_addrs(x, y) or (UNUSED,) * 3)))
+
+
+class Custom_Board(IS31FL3741_colorXY):
+    """Supports any IS31FL3741 RGB board whose layout is given by a mapping
+    file. The mapping is loaded into array-backed tables once, at
+    construction, so pixel access does no per-pixel address arithmetic.
+
+    :param ~busio.I2C i2c: the connected i2c bus
+    :param mapping:  Mapping file name (see module description for formats).
+    :param address:  the device address; defaults to 0x30
+    :param allocate: buffer allocation strategy, as for IS31FL3741.
+    :param order:    Pixel RGB color order, one of the IS3741_* color types.
+                     Default is the order named in the mapping file.
+    :param cache_size: CACHE_BUFFER cache size, as for IS31FL3741.
+    """
+
+    def __init__(
+        self,
+        i2c: busio.I2C,
+        mapping: str,
+        address: int = _IS3741_ADDR_DEFAULT,
+        allocate: int = NO_BUFFER,
+        order: Optional[int] = None,
+        cache_size: int = 32,
+    ):
+        width, height, file_order, self._ledmap = load_mapping(mapping)
+        if order is None:
+            order = file_order
+        super().__init__(
+            i2c,
+            width,
+            height,
+            address=address,
+            allocate=allocate,
+            order=order,
+            cache_size=cache_size,
+        )
+        self._pixel_map = compile_map(self._ledmap, width, height, order)
+        self._addrs = self._pixel_map.addrs
+
+    def pixel_addrs(self, x: int, y: int) -> Tuple[int, int, int]:
+        """Look up the device-order LED offsets for x,y pixel"""
+        i = (y * self.width + x) * 3
+        return (self._ledmap[i], self._ledmap[i + 1], self._ledmap[i + 2])
+
+    def pixel(self, x: int, y: int, color: Optional[int] = None) -> Union[int, None]:
+        """
+        Set or retrieve RGB color of pixel at position (X,Y). Missing pixels
+        are ignored.
+
+        :param x:     Horizontal pixel position.
+        :param y:     Vertical pixel position.
+        :param color: If setting, a packed 24-bit color value (0xRRGGBB).
+                      If getting, either None or leave off this argument.
+        :returns:     If setting, returns None. If getting, returns a packed
+                      24-bit color value (0xRRGGBB).
+        """
+        if 0 <= x < self.width and 0 <= y < self.height:  # Clip
+            i = (y * self.width + x) * 3
+            red = self._addrs[i]
+            if red == UNUSED:
+                return None
+            green = self._addrs[i + 1]
+            blue = self._addrs[i + 2]
+            buffer = self._pixel_buffer
+            if color is not None:
+                if buffer:
+                    buffer[red + 1] = (color >> 16) & 0xFF
+                    buffer[green + 1] = (color >> 8) & 0xFF
+                    buffer[blue + 1] = color & 0xFF
+                else:
+                    self[red] = (color >> 16) & 0xFF
+                    self[green] = (color >> 8) & 0xFF
+                    self[blue] = color & 0xFF
+            elif buffer:
+                return (buffer[red + 1] << 16) | (buffer[green + 1] << 8) | buffer[blue + 1]
+            else:
+                return (self[red] << 16) | (self[green] << 8) | self[blue]
+        return None
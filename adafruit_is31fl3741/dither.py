@@ -0,0 +1,209 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_is31fl3741.dither`
+====================================================
+
+Temporal dithering (frame rate control) for buffered IS31FL3741 devices.
+LED values carry a few bits below the 8-bit PWM step; the refresher cycles
+through a set of 8-bit sub-frames in which each LED is one step brighter in
+a share of the sub-frames matching its fraction, so the eye averages them
+to the in-between level. Sub-frames and the spans that differ between
+consecutive sub-frames are computed when values change, so refreshing only
+sends those spans.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+* `TemporalDither.run_async()` requires asyncio (the ``asyncio`` library
+  on CircuitPython).
+
+"""
+
+import array
+
+from .frame_pacer import FramePacer
+from .pixel_map import UNUSED, merge_spans
+
+try:
+    # Used only for typing
+    from typing import Optional, Tuple
+
+    from adafruit_is31fl3741 import IS31FL3741
+except ImportError:
+    pass
+
+_LEDS = 351
+
+# Approximate I2C bytes per transfer beyond its data: device address and
+# register address, plus a page change (unlock and page select, each
+# address + register + value) where the transfer changes page
+_SPAN_OVERHEAD = 2
+_PAGE_OVERHEAD = 6
+
+
+def _patterns(subframes: int) -> Tuple[int, ...]:
+    """For each fraction 0..subframes-1, a bitmask of the sub-frames an LED
+    is one step brighter in. The extra steps are error-diffused over time,
+    so they are spread out evenly rather than bunched together."""
+    patterns = []
+    for fraction in range(subframes):
+        mask = 0
+        error = 0
+        for frame in range(subframes):
+            error += fraction
+            if error >= subframes:
+                error -= subframes
+                mask |= 1 << frame
+        patterns.append(mask)
+    return tuple(patterns)
+
+
+class TemporalDither:
+    """
+    Dithered LED values for a buffered device. Set values with ``dither[led]
+    = value`` (or `pixel()` on color boards), then call `step()` at the
+    refresh rate, or run `run()` / `run_async()`.
+
+    :param device:    A buffered `adafruit_is31fl3741.IS31FL3741` or any
+                      board class built on it.
+    :param subframes: Sub-frames per cycle, 2, 4, 8 or 16: each doubling
+                      adds one bit of depth. Values range from 0 to
+                      255 * subframes.
+    """
+
+    def __init__(self, device: IS31FL3741, subframes: int = 4):
+        if subframes not in {2, 4, 8, 16}:
+            raise ValueError("Subframes must be 2, 4, 8 or 16")
+        if not device._pixel_buffer:
+            raise ValueError("TemporalDither requires a buffered device")
+        self._device = device
+        self.subframes = subframes
+        self._patterns = _patterns(subframes)
+        # Neighbouring LEDs start their patterns at different sub-frames,
+        # so a uniform area doesn't pulse all at once
+        self._phase = bytearray((led * 5) % subframes for led in range(_LEDS))
+        self._values = array.array("H", [0] * _LEDS)
+        self._frames = [bytearray(_LEDS) for _ in range(subframes)]
+        self._spans = [()] * subframes  # Spans changing into each sub-frame
+        self._frame = 0
+        self._dirty = True
+        self._full = True
+
+    def __setitem__(self, led: int, value: int) -> None:
+        """Set an LED's value, 0 to 255 * subframes."""
+        self._values[led] = min(value, 255 * self.subframes)
+        self._dirty = True
+
+    def __getitem__(self, led: int) -> int:
+        return self._values[led]
+
+    def pixel(self, x: int, y: int, color: Tuple[int, int, int]) -> None:
+        """
+        Set the color of the pixel at position (X,Y) of a color display.
+
+        :param x:     Horizontal pixel position.
+        :param y:     Vertical pixel position.
+        :param color: Red, green and blue values, each 0 to 255 * subframes.
+        """
+        display = self._device
+        if 0 <= x < display.width and 0 <= y < display.height:  # Clip
+            i = (y * display.width + x) * 3
+            addrs = display.pixel_map.addrs
+            if addrs[i] != UNUSED:
+                for channel in range(3):
+                    self[addrs[i + channel]] = color[channel]
+
+    def fill(self, value: int = 0) -> None:
+        """Set every LED to the same value."""
+        value = min(value, 255 * self.subframes)
+        for led in range(_LEDS):
+            self._values[led] = value
+        self._dirty = True
+
+    def render(self) -> None:
+        """Compute the sub-frames and the spans differing between each and
+        the one before. Done by `step()` as needed."""
+        subframes = self.subframes
+        frames = self._frames
+        for led in range(_LEDS):
+            base, fraction = divmod(self._values[led], subframes)
+            pattern = self._patterns[fraction]
+            phase = self._phase[led]
+            for frame in range(subframes):
+                frames[frame][led] = base + ((pattern >> ((frame + phase) % subframes)) & 1)
+        for frame in range(subframes):
+            before = frames[frame - 1]
+            after = frames[frame]
+            self._spans[frame] = merge_spans(
+                {led for led in range(_LEDS) if before[led] != after[led]}
+            )
+        self._dirty = False
+        self._full = True
+
+    def step(self) -> None:
+        """Transmit the next sub-frame: only the spans that differ from the
+        previous one, or everything after values changed."""
+        if self._dirty:
+            self.render()
+        self._frame = (self._frame + 1) % self.subframes
+        frame = self._frames[self._frame]
+        device = self._device
+        buffer = device._pixel_buffer
+        if self._full:
+            buffer[1:352] = frame
+            device.show()
+            self._full = False
+            return
+        for start, end in self._spans[self._frame]:
+            buffer[start + 1 : end + 1] = frame[start:end]
+            device._write_span(start, end)
+
+    def bus_load(self, rate: float) -> float:
+        """Estimated I2C traffic of refreshing the current values, in bytes
+        per second (about 9 bits each on the wire, with acknowledges).
+
+        :param rate: Sub-frames per second, e.g. 4 sub-frames x 60 Hz = 240.
+        """
+        if self._dirty:
+            self.render()
+        total = 0
+        for spans in self._spans:
+            page = None
+            for start, end in spans:
+                total += end - start + _SPAN_OVERHEAD
+                if (start < 180) != page:
+                    page = start < 180
+                    total += _PAGE_OVERHEAD
+        return total * rate / self.subframes
+
+    def show(self) -> None:
+        """Same as `step()`, so a `adafruit_is31fl3741.frame_pacer.FramePacer`
+        can pace the refresh."""
+        self.step()
+
+    def run(self, rate: float, cycles: Optional[int] = None) -> None:
+        """Refresh at a fixed rate, paced by a
+        `adafruit_is31fl3741.frame_pacer.FramePacer`: when running behind,
+        late sub-frames are skipped.
+
+        :param rate:   Sub-frames per second.
+        :param cycles: Full sub-frame cycles to run, or None to run forever.
+        """
+        frames = None if cycles is None else cycles * self.subframes
+        FramePacer(self, rate).run(None, frames)
+
+    async def run_async(self, rate: float) -> None:
+        """Refresh at a fixed rate as an asyncio task, e.g.
+        ``asyncio.create_task(dither.run_async(240))``, while other tasks
+        change values."""
+        await FramePacer(self, rate).run_async(None)
@@ -0,0 +1,110 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_is31fl3741.downsample`
+====================================================
+
+Area-average (box filter) downsampling from a high resolution RGB888
+canvas to an IS31FL3741 RGB board, the pure-Python counterpart of the
+``scale=True`` option of the native ``is31fl3741.IS31FL3741_FrameBuffer``.
+Render anti-aliased text or graphics at N times the board's resolution,
+then reduce it with integer math only.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+"""
+
+import array
+
+from .pixel_map import UNUSED
+
+try:
+    # Used only for typing
+    from typing import Optional
+
+    from circuitpython_typing import ReadableBuffer
+
+    from adafruit_is31fl3741 import IS31FL3741_colorXY
+except ImportError:
+    pass
+
+_WEIGHT_BITS = 16  # Fixed point precision of the averaging weight
+
+
+class Downsampler:
+    """
+    Reduces an RGB888 canvas of (width * scale) x (height * scale) pixels
+    to a buffered (PREFER_BUFFER or MUST_BUFFER) color display, each board
+    pixel taking the average of a scale x scale block.
+
+    :param display: Target color display.
+    :param scale:   Integer ratio of canvas to board resolution, 1 to 16,
+                    e.g. 3 for a 54x15 canvas on the 18x5 LED glasses.
+    :param stride:  Bytes per canvas row; default is width * scale * 3.
+    """
+
+    def __init__(self, display: IS31FL3741_colorXY, scale: int, stride: Optional[int] = None):
+        if not 1 <= scale <= 16:
+            raise ValueError("Scale must be 1 ~ 16")
+        if not display._pixel_buffer:
+            raise ValueError("Downsampler requires a buffered display")
+        self._display = display
+        self.scale = scale
+        self.width = display.width * scale
+        self.height = display.height * scale
+        if stride is None:
+            stride = self.width * 3
+        self.stride = stride
+        # Reciprocal of the block area, rounded up: sum * weight >> bits is
+        # then the mean, and a uniform block (of up to 256 pixels) comes back
+        # unchanged rather than one lower
+        self._weight = -(-(1 << _WEIGHT_BITS) // (scale * scale))
+        # Byte offsets of each block pixel relative to the block's corner
+        self._block = array.array(
+            "L", (row * stride + col * 3 for row in range(scale) for col in range(scale))
+        )
+        # Per board pixel: canvas offset of its block, and R,G,B positions
+        # in the pixel buffer
+        addrs = display.pixel_map.addrs
+        corners = []
+        targets = []
+        for y in range(display.height):
+            for x in range(display.width):
+                i = (y * display.width + x) * 3
+                if addrs[i] != UNUSED:
+                    corners.append(y * scale * stride + x * scale * 3)
+                    targets.extend((addrs[i] + 1, addrs[i + 1] + 1, addrs[i + 2] + 1))
+        self._corners = array.array("L", corners)
+        self._targets = array.array("H", targets)
+
+    def render(self, src: ReadableBuffer) -> None:
+        """Downsample a canvas into the display's pixel buffer. Call the
+        display's ``show()`` afterward to transmit it.
+
+        :param src: Canvas, RGB888, row by row.
+        """
+        buffer = self._display._pixel_buffer
+        block = self._block
+        weight = self._weight
+        targets = self._targets
+        for p, corner in enumerate(self._corners):
+            red = green = blue = 0
+            for offset in block:
+                pos = corner + offset
+                red += src[pos]
+                green += src[pos + 1]
+                blue += src[pos + 2]
+            t = p * 3
+            buffer[targets[t]] = (red * weight) >> _WEIGHT_BITS
+            buffer[targets[t + 1]] = (green * weight) >> _WEIGHT_BITS
+            buffer[targets[t + 2]] = (blue * weight) >> _WEIGHT_BITS
@@ -0,0 +1,221 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_is31fl3741.fade`
+====================================================
+
+Hardware fades for the IS31FL3741. Rather than rewriting every PWM byte on
+each step, a whole-display fade animates the single global current
+register, and a regional fade animates the per-LED scaling registers of
+just the LEDs involved. Levels follow a precomputed easing table, so a
+one-second fade is a few dozen short writes.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+* `Fade.run_async()` requires asyncio (the ``asyncio`` library on
+  CircuitPython).
+
+"""
+
+from .frame_pacer import FramePacer
+from .pixel_map import UNUSED
+
+try:
+    # Used only for typing
+    from typing import Iterable, List, Optional
+
+    from adafruit_is31fl3741 import IS31FL3741, IS31FL3741_colorXY
+except ImportError:
+    pass
+
+LINEAR = 0
+EASE_IN = 1  # Slow start; closest to perceived brightness when fading up
+EASE_OUT = 2  # Slow finish
+EASE_IN_OUT = 3  # Slow start and finish (smoothstep)
+
+# Easing tables, shared by every fade with the same steps and curve
+_tables = {}
+
+
+def easing_table(steps: int, curve: int = EASE_IN_OUT) -> bytearray:
+    """Progress at each of steps + 1 points of a fade, from 0 (start
+    level) to 255 (end level). Tables are computed once and cached.
+
+    :param steps: Number of steps after the starting point.
+    :param curve: LINEAR, EASE_IN, EASE_OUT or EASE_IN_OUT.
+    """
+    if steps < 1:
+        raise ValueError("Steps must be 1 or more")
+    key = (steps, curve)
+    table = _tables.get(key)
+    if table is None:
+        table = bytearray(steps + 1)
+        for i in range(steps + 1):
+            t = i / steps
+            if curve == EASE_IN:
+                t *= t
+            elif curve == EASE_OUT:
+                t = 1 - (1 - t) * (1 - t)
+            elif curve == EASE_IN_OUT:
+                t = t * t * (3 - 2 * t)
+            elif curve != LINEAR:
+                raise ValueError("Unknown easing curve")
+            table[i] = int(t * 255 + 0.5)
+        _tables[key] = table
+    return table
+
+
+def region_leds(display: IS31FL3741_colorXY, x: int, y: int, width: int, height: int) -> List:
+    """LED indices of every channel of the pixels in a rectangle of a color
+    display, for a regional `Fade`.
+
+    :param display: Color display.
+    :param x:       Left column.
+    :param y:       Top row.
+    :param width:   Rectangle width in pixels.
+    :param height:  Rectangle height in pixels.
+    """
+    addrs = display.pixel_map.addrs
+    leds = []
+    for row in range(max(0, y), min(display.height, y + height)):
+        for col in range(max(0, x), min(display.width, x + width)):
+            i = (row * display.width + col) * 3
+            if addrs[i] != UNUSED:
+                leds.extend(addrs[i : i + 3])
+    return leds
+
+
+class Fade:
+    """
+    A fade between two levels, either of the global current (whole
+    display) or of the scaling registers of some LEDs (a region). Nothing
+    else is touched: PWM values and other LEDs' scaling stay as they are,
+    and scaling levels aren't read back, so set the start level to match
+    the LEDs' current scaling.
+
+    :param device:   `adafruit_is31fl3741.IS31FL3741` or any board class
+                     built on it.
+    :param start:    Level at the start of the fade, 0 to 255.
+    :param end:      Level at the end of the fade, 0 to 255.
+    :param duration: Length of the fade in seconds, for `run()`.
+    :param steps:    Number of level changes after the start level.
+    :param curve:    LINEAR, EASE_IN, EASE_OUT or EASE_IN_OUT.
+    :param leds:     LED indices whose scaling to fade (e.g. from
+                     `region_leds()`), or None to fade the global current.
+
+    .. py:attribute:: pacer
+
+        The `adafruit_is31fl3741.frame_pacer.FramePacer` timing `run()`.
+    """
+
+    def __init__(
+        self,
+        device: IS31FL3741,
+        start: int,
+        end: int,
+        duration: float = 1.0,
+        steps: int = 32,
+        curve: int = EASE_IN_OUT,
+        leds: Optional[Iterable[int]] = None,
+    ):
+        if steps < 1:
+            raise ValueError("Steps must be 1 or more")
+        if duration <= 0:
+            raise ValueError("Duration must be positive")
+        self._device = device
+        self.start = start
+        self.end = end
+        self.interval = duration / steps
+        self.pacer = FramePacer(self, steps / duration)
+        self._base = 0  # Step run() started from
+        self._table = easing_table(steps, curve)
+        self._runs = None
+        if leds is not None:
+            # Runs of consecutive LEDs, each with a write buffer holding the
+            # register address then the levels, split at the page boundary
+            self._runs = []
+            first = last = None
+            for led in sorted(set(leds)):
+                if first is not None and (led != last + 1 or led == 180):
+                    self._runs.append((first, bytearray(last - first + 2)))
+                    first = None
+                if first is None:
+                    first = led
+                last = led
+            if first is not None:
+                self._runs.append((first, bytearray(last - first + 2)))
+        self.reset()
+
+    def reset(self) -> None:
+        """Rewind to the start of the fade."""
+        self._step = 0
+        self._level = None
+
+    @property
+    def done(self) -> bool:
+        """True once the end level has been written."""
+        return self._step >= len(self._table)
+
+    def _write(self, level: int) -> None:
+        if self._runs is None:
+            self._device.global_current = level
+            return
+        for start, buffer in self._runs:
+            for i in range(1, len(buffer)):
+                buffer[i] = level
+            self._device._write_scaling_span(start, buffer)
+
+    def step(self) -> bool:
+        """Write the next level immediately, skipping the write if the
+        level didn't change.
+
+        :returns: False if the fade had already finished, else True.
+        """
+        if self.done:
+            return False
+        level = self.start + (self.end - self.start) * self._table[self._step] // 255
+        if level != self._level:
+            self._write(level)
+            self._level = level
+        self._step += 1
+        return True
+
+    def show(self) -> None:
+        """Write the level `pacer` is due to write, skipping levels it fell
+        behind on. Called by the pacer during `run()`."""
+        self._step = max(
+            self._step, min(self._base + self.pacer.frame_number, len(self._table) - 1)
+        )
+        self.step()
+
+    def _start_run(self) -> int:
+        """Reset the pacer for the rest of the fade. Returns how many paced
+        steps come before the last one, which is written with no wait after
+        it."""
+        self.pacer.reset()
+        self._base = self._step
+        return len(self._table) - 1 - self._step
+
+    def run(self) -> None:
+        """Run the fade to the end, paced to span its duration."""
+        if self.done:
+            return
+        self.pacer.run(None, self._start_run())
+        self.show()
+
+    async def run_async(self) -> None:
+        """As `run()`, yielding to other tasks between steps."""
+        if self.done:
+            return
+        await self.pacer.run_async(None, self._start_run())
+        self.show()
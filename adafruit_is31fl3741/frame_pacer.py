@@ -0,0 +1,180 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_is31fl3741.frame_pacer`
+====================================================
+
+Frame rate governor for IS31FL3741 displays. Each frame is rendered and
+shown, then the rest of its time budget is slept (or yielded, under
+asyncio). When a frame runs so late that whole frames have passed, those
+frames are skipped rather than rendered, so content keeps real time.
+Rolling statistics tell whether rendering or the bus is the bottleneck.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+* `FramePacer.frame_async()` and `FramePacer.run_async()` require asyncio
+  (the ``asyncio`` library on CircuitPython).
+
+"""
+
+import array
+import time
+
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
+
+try:
+    # Used only for typing
+    from typing import Callable, Optional
+
+    from adafruit_is31fl3741 import IS31FL3741
+except ImportError:
+    pass
+
+
+class FramePacer:
+    """
+    Paces render-and-show cycles on a display at a target frame rate.
+
+    :param display: Anything with a ``show()`` method, e.g. an
+                    `adafruit_is31fl3741.IS31FL3741` board or
+                    IS31FL3741_PixelBuf.
+    :param fps:     Target frames per second.
+    :param window:  Number of recent frames the statistics cover.
+
+    .. py:attribute:: frame_number
+
+       Index of the frame being rendered, counting skipped frames, so
+       render functions can derive content time as frame_number / fps.
+
+    .. py:attribute:: frames_shown
+
+       Frames rendered and shown.
+
+    .. py:attribute:: frames_dropped
+
+       Frames skipped because the loop was running behind.
+    """
+
+    def __init__(self, display: IS31FL3741, fps: float = 30, window: int = 30):
+        self._display = display
+        self.fps = fps
+        # Recent render, transmit and frame-to-frame times, as ring buffers
+        self._render = array.array("f", [0] * window)
+        self._transmit = array.array("f", [0] * window)
+        self._period = array.array("f", [0] * window)
+        self.reset()
+
+    def reset(self) -> None:
+        """Restart timing and statistics, e.g. after a pause."""
+        self.frame_number = 0
+        self.frames_shown = 0
+        self.frames_dropped = 0
+        self._next_time = None
+        for samples in (self._render, self._transmit, self._period):
+            for i in range(len(samples)):
+                samples[i] = 0
+        self._slot = 0
+        self._count = 0  # Render/transmit samples held
+        self._periods = 0  # Frame-to-frame samples held
+        self._last_end = None
+
+    def _begin(self) -> None:
+        """Skip any frames whose time has entirely passed."""
+        now = time.monotonic()
+        if self._next_time is None:
+            self._next_time = now
+            return
+        budget = 1 / self.fps
+        late = int((now - self._next_time) / budget)
+        if late > 0:
+            self.frames_dropped += late
+            self.frame_number += late
+            self._next_time += late * budget
+
+    def _render_and_show(self, render: Optional[Callable]) -> None:
+        start = time.monotonic()
+        if render is not None:
+            render()
+        shown = time.monotonic()
+        self._display.show()
+        end = time.monotonic()
+        slot = self._slot
+        window = len(self._render)
+        self._render[slot] = shown - start
+        self._transmit[slot] = end - shown
+        self._count = min(self._count + 1, window)
+        if self._last_end is not None:
+            self._period[slot] = end - self._last_end
+            self._periods = min(self._periods + 1, window)
+        self._slot = (slot + 1) % window
+        self._last_end = end
+        self.frames_shown += 1
+        self.frame_number += 1
+        self._next_time += 1 / self.fps
+
+    def frame(self, render: Optional[Callable] = None) -> None:
+        """Render and show one frame, then sleep out the rest of its
+        budget.
+
+        :param render: Function drawing the frame (no arguments), or None
+                       to only show.
+        """
+        self._begin()
+        self._render_and_show(render)
+        delay = self._next_time - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def frame_async(self, render: Optional[Callable] = None) -> None:
+        """As `frame()`, yielding to other tasks instead of sleeping. Always
+        yields at least once."""
+        self._begin()
+        self._render_and_show(render)
+        await asyncio.sleep(max(0, self._next_time - time.monotonic()))
+
+    def run(self, render: Optional[Callable], frames: Optional[int] = None) -> None:
+        """Render and show frames at the target rate.
+
+        :param render: Function drawing a frame (no arguments), or None to
+                       only show.
+        :param frames: Number of frame slots to run for, shown or dropped,
+                       or None to run forever.
+        """
+        end = None if frames is None else self.frame_number + frames
+        while end is None or self.frame_number < end:
+            self.frame(render)
+
+    async def run_async(self, render: Optional[Callable], frames: Optional[int] = None) -> None:
+        """As `run()`, as an asyncio task."""
+        end = None if frames is None else self.frame_number + frames
+        while end is None or self.frame_number < end:
+            await self.frame_async(render)
+
+    @property
+    def render_time(self) -> float:
+        """Mean seconds spent rendering, over recent frames."""
+        return sum(self._render) / self._count if self._count else 0.0
+
+    @property
+    def transmit_time(self) -> float:
+        """Mean seconds spent in ``show()``, over recent frames."""
+        return sum(self._transmit) / self._count if self._count else 0.0
+
+    @property
+    def achieved_fps(self) -> float:
+        """Frames actually shown per second, over recent frames."""
+        total = sum(self._period)
+        return self._periods / total if total > 0 else 0.0
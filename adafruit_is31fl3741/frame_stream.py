@@ -0,0 +1,265 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_is31fl3741.frame_stream`
+====================================================
+
+Compact file format for long IS31FL3741 animations, played back frame by
+frame in constant memory regardless of file length.
+
+A file starts with a 14-byte big-endian header:
+
+* ``b"I3FS"`` magic and a format version byte
+* a flags byte (reserved, 0)
+* a 16-bit board/mapping id, chosen by the application, so players can
+  refuse files made for a different board
+* a 32-bit frame count
+* a 16-bit frame interval in milliseconds
+
+Then one record per frame: a type byte, a 16-bit payload length, and the
+payload. Payloads are run-length encoded as (count, value) byte pairs,
+either of the 351 PWM bytes themselves (key frame) or of their XOR with the
+previous frame (delta frame, where unchanged bytes become long zero runs).
+The first frame is always a key frame.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+* Memory-mapped playback uses ``mmap`` where available (CPython); elsewhere
+  frames are read in small chunks.
+
+"""
+
+from struct import pack, unpack, unpack_from
+
+from .frame_pacer import FramePacer
+
+try:
+    import mmap
+except ImportError:
+    mmap = None
+
+try:
+    # Used only for typing
+    from typing import BinaryIO, Optional
+
+    from adafruit_is31fl3741 import IS31FL3741
+except ImportError:
+    pass
+
+_MAGIC = b"I3FS"
+_VERSION = 1
+_HEADER = ">4sBBHIH"
+_HEADER_SIZE = 14
+_RECORD = ">BH"
+_RECORD_SIZE = 3
+_FRAME_SIZE = 351
+
+FRAME_KEY = 0  # Payload is RLE of the frame
+FRAME_XOR = 1  # Payload is RLE of the frame XOR the previous frame
+
+
+def _rle(data: bytes) -> bytes:
+    out = bytearray()
+    i = 0
+    while i < len(data):
+        value = data[i]
+        count = 1
+        while count < 255 and i + count < len(data) and data[i + count] == value:
+            count += 1
+        out.append(count)
+        out.append(value)
+        i += count
+    return bytes(out)
+
+
+class StreamWriter:
+    """
+    Writes frames to a stream file. The frame count in the header is filled
+    in by `close()`, so the file must be seekable.
+
+    :param file:        Binary file opened for writing.
+    :param interval_ms: Time between frames, in milliseconds.
+    :param map_id:      Application-chosen board/mapping id, 0 to 65535.
+    """
+
+    def __init__(self, file: BinaryIO, interval_ms: int, map_id: int = 0):
+        self._file = file
+        self._interval = interval_ms
+        self._map_id = map_id
+        self._count = 0
+        self._last = None
+        file.write(pack(_HEADER, _MAGIC, _VERSION, 0, map_id, 0, interval_ms))
+
+    def add_frame(self, frame: bytes) -> None:
+        """Append a frame, delta-encoded against the previous one where that
+        is smaller.
+
+        :param frame: 351 PWM bytes in device order, e.g.
+                      ``display._pixel_buffer[1:352]`` after ``show()``.
+        """
+        frame = bytes(frame)
+        if len(frame) != _FRAME_SIZE:
+            raise ValueError("Frame must be 351 bytes")
+        kind = FRAME_KEY
+        payload = _rle(frame)
+        if self._last is not None:
+            delta = _rle(bytes(a ^ b for a, b in zip(frame, self._last)))
+            if len(delta) < len(payload):
+                kind = FRAME_XOR
+                payload = delta
+        self._file.write(pack(_RECORD, kind, len(payload)))
+        self._file.write(payload)
+        self._last = frame
+        self._count += 1
+
+    def close(self) -> None:
+        """Fill in the frame count. Does not close the file itself."""
+        self._file.seek(0)
+        self._file.write(
+            pack(_HEADER, _MAGIC, _VERSION, 0, self._map_id, self._count, self._interval)
+        )
+        self._file.seek(0, 2)
+
+
+class StreamPlayer:
+    """
+    Plays a stream file on a buffered device, decoding each frame straight
+    into its pixel buffer. Delta frames build on the buffer's contents, so
+    don't draw to the device between frames.
+
+    :param device: A buffered `adafruit_is31fl3741.IS31FL3741` (or any board
+                   class built on it).
+    :param file:   Binary file opened for reading. Memory-mapped if the
+                   platform allows, otherwise read in per-frame chunks.
+    :param map_id: If given, raise ValueError if the file was made for a
+                   different board/mapping id.
+
+    .. py:attribute:: pacer
+
+        The `adafruit_is31fl3741.frame_pacer.FramePacer` timing `play()`,
+        holding its frame rate and drop statistics.
+    """
+
+    def __init__(self, device: IS31FL3741, file: BinaryIO, map_id: Optional[int] = None):
+        if not device._pixel_buffer:
+            raise ValueError("StreamPlayer requires a buffered device")
+        self._device = device
+        self._file = file
+        self._map = None
+        if mmap is not None:
+            try:
+                self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (AttributeError, OSError, ValueError):
+                pass
+        if self._map is None:
+            # Largest possible payload: one (count, value) pair per byte
+            self._chunk = bytearray(_FRAME_SIZE * 2)
+        magic, version, _, file_map_id, self.frame_count, self.interval_ms = unpack(
+            _HEADER, self._read_at(0, _HEADER_SIZE)
+        )
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("Not an IS31FL3741 frame stream")
+        if map_id is not None and map_id != file_map_id:
+            raise ValueError("Frame stream is for a different board")
+        self.map_id = file_map_id
+        self.pacer = FramePacer(self, 1000 / max(1, self.interval_ms))
+        self._played = 0  # Frames decoded since play() started
+        self._last = None  # Last frame play() shows, or None to repeat forever
+        self.reset()
+
+    def _read_at(self, offset: int, length: int):
+        """Bytes at offset, as a view of the mapped file or of the chunk
+        buffer (valid until the next read)."""
+        if self._map is not None:
+            return memoryview(self._map)[offset : offset + length]
+        self._file.seek(offset)
+        view = memoryview(self._chunk)[:length]
+        self._file.readinto(view)
+        return view
+
+    def reset(self) -> None:
+        """Rewind to the first frame."""
+        self._offset = _HEADER_SIZE
+        self.frame = 0
+
+    def step(self) -> bool:
+        """Decode and show the next frame immediately.
+
+        :returns: False if there were no frames left, else True.
+        """
+        if not self._decode():
+            return False
+        self._device.show()
+        return True
+
+    def show(self) -> None:
+        """Show the frame `pacer` is due to show, rewinding at the end of
+        the stream. Frames it skipped to keep up are decoded but not
+        transmitted. Called by the pacer during `play()`."""
+        target = self.pacer.frame_number
+        if self._last is not None:
+            target = min(target, self._last)
+        while self._played <= target:
+            if not self._decode():
+                self.reset()
+                self._decode()
+            self._played += 1
+        self._device.show()
+
+    def _decode(self) -> bool:
+        """Decode the next frame into the pixel buffer.
+
+        :returns: False if there were no frames left, else True.
+        """
+        if self.frame >= self.frame_count:
+            return False
+        kind, length = unpack_from(_RECORD, self._read_at(self._offset, _RECORD_SIZE))
+        payload = self._read_at(self._offset + _RECORD_SIZE, length)
+        buffer = self._device._pixel_buffer
+        pos = 1
+        for i in range(0, length, 2):
+            count = payload[i]
+            value = payload[i + 1]
+            if kind == FRAME_KEY:
+                for j in range(pos, pos + count):
+                    buffer[j] = value
+            elif value:
+                for j in range(pos, pos + count):
+                    buffer[j] ^= value
+            pos += count
+        self._offset += _RECORD_SIZE + length
+        self.frame += 1
+        return True
+
+    def play(self, loops: Optional[int] = 1) -> None:
+        """Play the stream at its frame interval, paced by `pacer`: when
+        running behind, late frames are skipped.
+
+        :param loops: Number of times to play the stream, or None to repeat
+                      forever.
+        """
+        if not self.frame_count:
+            return
+        self.reset()
+        self.pacer.fps = 1000 / max(1, self.interval_ms)
+        self.pacer.reset()
+        self._played = 0
+        frames = None if loops is None else loops * self.frame_count
+        self._last = None if frames is None else frames - 1
+        self.pacer.run(None, frames)
+
+    def close(self) -> None:
+        """Release the memory map, if any. Does not close the file itself."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
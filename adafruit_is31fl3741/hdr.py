@@ -0,0 +1,162 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_is31fl3741.hdr`
+====================================================
+
+Extended dynamic range drawing for IS31FL3741 RGB boards. Each LED's
+brightness is its 8-bit PWM value times its 8-bit scaling register, so
+12- to 16-bit channel values can be split across the two: dim values use a
+low scaling level and keep full PWM resolution instead of banding in the
+bottom few PWM steps. The split is worked out from the full-precision
+value, and only scaling registers that changed are transmitted.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+"""
+
+from .pixel_map import SPAN_GAP, UNUSED
+
+try:
+    # Used only for typing
+    from typing import Tuple
+
+    from adafruit_is31fl3741 import IS31FL3741_colorXY
+except ImportError:
+    pass
+
+# Scaling levels used, so that during fades scaling changes only when a
+# channel crosses a power-of-two boundary, not on every step
+_SCALES = (1, 2, 4, 8, 16, 32, 64, 128, 255)
+
+
+def _build_scale_table() -> bytearray:
+    """Scaling level for each brightness target (PWM x scaling, out of
+    255 x 255), indexed by the target / 255 rounded up: the lowest level
+    at which the target is still reachable with PWM of at most 255."""
+    table = bytearray(256)
+    for index in range(256):
+        for scale in _SCALES:
+            if index <= scale:
+                break
+        table[index] = scale
+    return table
+
+
+class HDRSurface:
+    """
+    High dynamic range drawing surface for a buffered (PREFER_BUFFER or
+    MUST_BUFFER) color display. Draw with `pixel()` and `fill()`, then
+    `show()` sends the PWM values and any changed scaling registers. The
+    surface takes over the scaling registers: the first `show()` sets
+    those of LEDs outside the display's map to full, so don't use
+    ``set_led_scaling()`` alongside it.
+
+    :param display: Target color display.
+    :param bits:    Bits per channel value, 12 to 16.
+    """
+
+    _scale_table = None  # Built on first use and shared
+
+    def __init__(self, display: IS31FL3741_colorXY, bits: int = 16):
+        if not 12 <= bits <= 16:
+            raise ValueError("Bits must be 12 ~ 16")
+        if not display._pixel_buffer:
+            raise ValueError("HDRSurface requires a buffered display")
+        if HDRSurface._scale_table is None:
+            HDRSurface._scale_table = _build_scale_table()
+        self._display = display
+        self.width = display.width
+        self.height = display.height
+        self.bits = bits
+        # Targets are value * 65025 / top, rounded. Computed as value plus
+        # value * excess / top, which stays within small ints at 16 bits.
+        self._top = (1 << bits) - 1
+        self._excess = 65025 - self._top
+        self._addrs = display.pixel_map.addrs
+        # Scaling laid out like the pixel buffer: a spare byte, then one per
+        # LED. None sent yet, so the first show() sends every scaling value.
+        self._scaling = bytearray(b"\xff" * 352)
+        self._sent = None
+
+    def pixel(self, x: int, y: int, color: Tuple[int, int, int]) -> None:
+        """
+        Set the color of the pixel at position (X,Y).
+
+        :param x:     Horizontal pixel position.
+        :param y:     Vertical pixel position.
+        :param color: Red, green and blue values, each 0 to 2**bits - 1;
+                      higher values are clamped.
+        """
+        if 0 <= x < self.width and 0 <= y < self.height:  # Clip
+            i = (y * self.width + x) * 3
+            if self._addrs[i] != UNUSED:
+                self._set(i, color)
+
+    def _set(self, i: int, color: Tuple[int, int, int]) -> None:
+        buffer = self._display._pixel_buffer
+        scaling = self._scaling
+        table = self._scale_table
+        top = self._top
+        for channel in range(3):
+            value = min(color[channel], top)
+            target = value + (value * self._excess + top // 2) // top
+            scale = table[(target + 254) // 255]
+            led = self._addrs[i + channel] + 1
+            buffer[led] = (target + scale // 2) // scale
+            scaling[led] = scale
+
+    def fill(self, color: Tuple[int, int, int] = (0, 0, 0)) -> None:
+        """Set all pixels to a given color.
+
+        :param color: Red, green and blue values, each 0 to 2**bits - 1.
+        """
+        for i in range(0, len(self._addrs), 3):
+            if self._addrs[i] != UNUSED:
+                self._set(i, color)
+
+    def _send_scaling(self) -> None:
+        """Transmit scaling registers that differ from those last sent,
+        runs close together merged into one write per page."""
+        scaling = self._scaling
+        sent = self._sent
+        device = self._display
+        led = 0
+        while led < 351:
+            if scaling[led + 1] == sent[led + 1]:
+                led += 1
+                continue
+            # Extend the span while further changes are near, within a page
+            page_end = 180 if led < 180 else 351
+            end = last = led
+            while end < page_end and end - last <= SPAN_GAP:
+                if scaling[end + 1] != sent[end + 1]:
+                    last = end
+                end += 1
+            end = last + 1
+            # Write straight from the scaling buffer, the byte before the
+            # span temporarily holding the register address
+            save = scaling[led]
+            device._write_scaling_span(led, memoryview(scaling)[led : end + 1])
+            scaling[led] = save
+            sent[led + 1 : end + 1] = scaling[led + 1 : end + 1]
+            led = end
+
+    def show(self) -> None:
+        """Transmit PWM values and changed scaling registers."""
+        if self._sent is None:
+            self._sent = bytearray(352)
+            for i in range(352):
+                self._sent[i] = self._scaling[i] ^ 0xFF  # Differs everywhere
+        self._send_scaling()
+        self._display.show()
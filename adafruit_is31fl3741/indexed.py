@@ -0,0 +1,158 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_is31fl3741.indexed`
+====================================================
+
+Palette (indexed color) drawing surface for IS31FL3741 RGB boards. Pixels
+hold 4- or 8-bit palette indices, expanded into the display's pixel buffer
+only when shown, so palette cycling animations change a few palette entries
+rather than redrawing pixels.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+"""
+
+import array
+
+from .pixel_map import UNUSED
+
+try:
+    # Used only for typing
+    from typing import Optional, Union
+
+    from adafruit_is31fl3741 import IS31FL3741_colorXY
+except ImportError:
+    pass
+
+
+class IndexedSurface:
+    """
+    Indexed color surface the size of a buffered (PREFER_BUFFER or
+    MUST_BUFFER) color display.
+
+    :param display: Target color display.
+    :param bits:    Bits per pixel, 4 (16 colors) or 8 (256 colors).
+    """
+
+    def __init__(self, display: IS31FL3741_colorXY, bits: int = 4):
+        if bits not in {4, 8}:
+            raise ValueError("Bits must be 4 or 8")
+        if not display._pixel_buffer:
+            raise ValueError("IndexedSurface requires a buffered display")
+        self._display = display
+        self.width = display.width
+        self.height = display.height
+        self.bits = bits
+        count = self.width * self.height
+        self._indices = bytearray(count if bits == 8 else (count + 1) // 2)
+        # Palette as R,G,B bytes per entry, i.e. ready for the pixel buffer
+        self._palette = bytearray(3 << bits)
+        # Pixel buffer positions for each pixel's R,G,B
+        addrs = display.pixel_map.addrs
+        self._targets = array.array("H", (UNUSED if led == UNUSED else led + 1 for led in addrs))
+        self._dirty = True
+
+    def __setitem__(self, index: int, color: int) -> None:
+        """Set a palette entry.
+
+        :param index: Palette index.
+        :param color: Packed 24-bit color (0xRRGGBB).
+        """
+        self._palette[index * 3] = (color >> 16) & 0xFF
+        self._palette[index * 3 + 1] = (color >> 8) & 0xFF
+        self._palette[index * 3 + 2] = color & 0xFF
+        self._dirty = True
+
+    def __getitem__(self, index: int) -> int:
+        """Get a palette entry as a packed 24-bit color."""
+        pal = self._palette
+        return (pal[index * 3] << 16) | (pal[index * 3 + 1] << 8) | pal[index * 3 + 2]
+
+    def rotate_palette(self, start: int, end: int, steps: int = 1) -> None:
+        """Cycle palette entries start through end-1, moving each color
+        steps entries higher (wrapping around).
+
+        :param start: First palette index.
+        :param end:   Palette index after the last one.
+        :param steps: Entries to rotate by; negative rotates downward.
+        """
+        if not 0 <= start <= end <= 1 << self.bits:
+            raise ValueError("Palette range must be 0 <= start <= end <= palette size")
+        if start == end:
+            return
+        steps %= end - start
+        if steps:
+            pal = self._palette
+            cut = (end - steps) * 3
+            pal[start * 3 : end * 3] = pal[cut : end * 3] + pal[start * 3 : cut]
+            self._dirty = True
+
+    def pixel(self, x: int, y: int, index: Optional[int] = None) -> Union[int, None]:
+        """
+        Set or retrieve palette index of pixel at position (X,Y).
+
+        :param x:     Horizontal pixel position.
+        :param y:     Vertical pixel position.
+        :param index: If setting, palette index.
+                      If getting, either None or leave off this argument.
+        :returns:     If setting, returns None. If getting, returns the
+                      palette index.
+        """
+        if 0 <= x < self.width and 0 <= y < self.height:  # Clip
+            pos = y * self.width + x
+            if self.bits == 8:
+                if index is None:
+                    return self._indices[pos]
+                self._indices[pos] = index
+            else:
+                shift = 0 if pos & 1 else 4  # High nibble first
+                if index is None:
+                    return (self._indices[pos >> 1] >> shift) & 0x0F
+                byte = self._indices[pos >> 1]
+                self._indices[pos >> 1] = (byte & (0xF0 >> shift)) | ((index & 0x0F) << shift)
+            self._dirty = True
+        return None
+
+    def fill(self, index: int = 0) -> None:
+        """Set all pixels to a given palette index."""
+        value = index if self.bits == 8 else (index & 0x0F) * 0x11
+        for i in range(len(self._indices)):
+            self._indices[i] = value
+        self._dirty = True
+
+    def render(self) -> None:
+        """Expand palette indices into the display's pixel buffer, if
+        anything changed since the last render."""
+        if not self._dirty:
+            return
+        buffer = self._display._pixel_buffer
+        targets = self._targets
+        pal = self._palette
+        indices = self._indices
+        for pos in range(self.width * self.height):
+            i = pos * 3
+            if targets[i] != UNUSED:
+                if self.bits == 8:
+                    color = indices[pos] * 3
+                else:
+                    color = ((indices[pos >> 1] >> (0 if pos & 1 else 4)) & 0x0F) * 3
+                buffer[targets[i]] = pal[color]
+                buffer[targets[i + 1]] = pal[color + 1]
+                buffer[targets[i + 2]] = pal[color + 2]
+        self._dirty = False
+
+    def show(self) -> None:
+        """Render and transmit to the display."""
+        self.render()
+        self._display.show()
@@ -15,8 +15,12 @@
 * Author(s): Mark Komus, Damien P. George, Scott Shawcroft, Carter Nelson, Rose Hooper
 """
 
+import array
+
 import adafruit_pixelbuf
 
+from .auto_write import AutoWriter
+
 try:
     # Used only for typing
     from types import TracebackType
@@ -60,6 +64,15 @@ class IS31FL3741_PixelBuf(adafruit_pixelbuf.PixelBuf):
       `show` must be called explicitly.
     :param str pixel_order: Set the pixel color channel order. GRBW is set by default.
     :param bool init: True if the IS31FL3741 chip should be initialized.
+    :param float auto_write_interval: If nonzero, with auto_write on, changes are
+      transmitted at most once per this many seconds through `auto_writer` rather than
+      on every assignment.
+
+    .. py:attribute:: auto_writer
+
+        The `adafruit_is31fl3741.auto_write.AutoWriter` coalescing auto-writes, or None.
+        Call its ``poll()`` from the main loop, or run its ``run()`` task under asyncio,
+        so the last change of a burst is shown.
 
     .. py:method:: IS31FL3741_PixelBuf.show()
 
@@ -81,7 +94,7 @@ class IS31FL3741_PixelBuf(adafruit_pixelbuf.PixelBuf):
 
     def __init__(
         self,
-        is31: Union[is31fl3741.IS31FL3741, IS31FL3741],
+        is31: Union["is31fl3741.IS31FL3741", "IS31FL3741"],
         mapping: tuple,
         *,
         addr: int = 0x30,
@@ -90,6 +103,7 @@ class IS31FL3741_PixelBuf(adafruit_pixelbuf.PixelBuf):
         auto_write: bool = True,
         pixel_order: str = None,
         init: bool = True,
+        auto_write_interval: float = 0,
     ):
         if not pixel_order:
             pixel_order = BGR if bpp == 3 else GRBW
@@ -99,13 +113,29 @@ class IS31FL3741_PixelBuf(adafruit_pixelbuf.PixelBuf):
 
         n = int(len(mapping) / 3)
 
-        super().__init__(n, brightness=brightness, byteorder=pixel_order, auto_write=auto_write)
+        # Auto-writes are done here rather than by the base class, so they
+        # can go through the auto_writer
+        super().__init__(n, brightness=brightness, byteorder=pixel_order, auto_write=False)
+        self._auto_write = auto_write
+        self.auto_writer = None
+        if auto_write_interval:
+            self.auto_writer = AutoWriter(self.show, auto_write_interval)
 
         self.is31fl3741 = is31
         self.addr = addr
         if not isinstance(mapping, tuple):
             raise AttributeError("Mapping must be a tuple")
         self.mapping = mapping
+        # With a buffered pure-Python IS31FL3741, frames are scattered
+        # straight into its pixel buffer through (source, destination) pairs
+        # computed once here, so transmitting allocates nothing
+        self._target = getattr(is31, "_pixel_buffer", None)
+        self._scatter = array.array("H")
+        if self._target:
+            for pos, led in enumerate(mapping):
+                if led != 65535:
+                    self._scatter.append(pos)
+                    self._scatter.append(led + 1)
 
         if init is True:
             self.initialize()
@@ -126,19 +156,66 @@ class IS31FL3741_PixelBuf(adafruit_pixelbuf.PixelBuf):
     ):
         self.deinit()
 
+    @property
+    def auto_write(self) -> bool:
+        """True if the pixels change when set, immediately or through the
+        `auto_writer`. If False, `show` must be called explicitly."""
+        return self._auto_write
+
+    @auto_write.setter
+    def auto_write(self, value: bool) -> None:
+        self._auto_write = value
+
+    def _auto_show(self) -> None:
+        if self.auto_writer is not None:
+            self.auto_writer.mark()
+        else:
+            self.show()
+
+    def __setitem__(self, index, val):
+        auto_write = self._auto_write
+        self._auto_write = False  # Keep the pure-Python base from showing
+        try:
+            super().__setitem__(index, val)
+        finally:
+            self._auto_write = auto_write
+        if auto_write:
+            self._auto_show()
+
+    def fill(self, color) -> None:
+        auto_write = self._auto_write
+        self._auto_write = False
+        try:
+            super().fill(color)
+        finally:
+            self._auto_write = auto_write
+        if auto_write:
+            self._auto_show()
+
     def __repr__(self):
         return "[" + ", ".join([str(x) for x in self]) + "]"
 
     def initialize(self) -> None:
-        """Initialize"""
-        self.is31fl3741.reset()
+        """Initialize: reset the chip, set all LED scaling to maximum, set the
+        global current and enable output. With the pure-Python
+        `adafruit_is31fl3741.IS31FL3741` scaling is set in one burst per
+        register page. The native ``is31fl3741`` module has no bulk scaling
+        call, so there it takes one transfer per LED."""
+        is31 = self.is31fl3741
+        is31.reset()
+
+        if hasattr(is31, "set_led_scaling"):  # adafruit_is31fl3741.IS31FL3741
+            is31.set_led_scaling(0xFF)
+            is31.global_current = 0xFE
+            is31.enable = True
+            return
 
         # Set scaling for all LEDs to maximum
         for led in range(352):
-            self.is31fl3741.set_led(led, 0xFF, 2)
+            is31.set_led(led, 0xFF, 2)
 
-        self.is31fl3741.set_global_current(0xFE)
-        self.is31fl3741.enable()
+        is31.set_global_current(0xFE)
+        is31.enable()
 
     @property
     def n(self) -> int:
@@ -154,4 +231,11 @@ class IS31FL3741_PixelBuf(adafruit_pixelbuf.PixelBuf):
         self.show()
 
     def _transmit(self, buffer: bytearray) -> None:
-        self.is31fl3741.write(self.mapping, buffer)
+        target = self._target
+        if not target:  # Native or unbuffered driver
+            self.is31fl3741.write(self.mapping, buffer)
+            return
+        scatter = self._scatter
+        for i in range(0, len(scatter), 2):
+            target[scatter[i + 1]] = buffer[scatter[i]]
+        self.is31fl3741.show()
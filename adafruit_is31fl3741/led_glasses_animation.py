@@ -6,6 +6,8 @@ LED Animation compatibility layer.
 
 import array
 
+from .auto_write import AutoWriter
+
 
 def _int_as_tuple(value):
     if isinstance(value, int):
@@ -38,6 +40,11 @@ class LED_Glasses_Animation:
     """
     Library that wraps the LED Glasses with neo-pixel like behaviour so that Adafruit LED Animation
     can work.
+
+    With auto_write on and a nonzero auto_write_interval, changes are transmitted at most once
+    per that many seconds through the `auto_writer` (an `adafruit_is31fl3741.auto_write.AutoWriter`)
+    instead of on every assignment; poll it from the main loop or run its asyncio task so the
+    last change of a burst is shown.
     """
 
     _brightness = 1
@@ -53,17 +60,21 @@ class LED_Glasses_Animation:
         brightness=1,
         left_start=21,
         right_start=8,
+        auto_write_interval=0,
     ):
         self._glasses = led_glasses
 
-        # improvements:
-        # Over, Under, Overlap, Not.
-        # Left Start, Right Start, Grid Order
+        # Grid and ring pixels that share an LED are last-writer-wins here;
+        # led_glasses_compositor.GlassesCompositor merges separate grid and
+        # ring layers with a policy instead.
 
         sequence = _setup_pixels(grid, led_glasses, left, left_start, right, right_start)
 
         self.brightness = brightness
         self.auto_write = auto_write
+        self.auto_writer = None
+        if auto_write_interval:
+            self.auto_writer = AutoWriter(self.show, auto_write_interval)
         self._map = array.array("H", sequence)
         self.n = len(self._map) // 3
 
@@ -101,27 +112,54 @@ class LED_Glasses_Animation:
     def __setitem__(self, key, value):
         if isinstance(key, slice):
             for idx, val in zip(self._range_for_slice(key), value):
-                r, g, b = self._map_pixel(idx)
-                self._glasses[r], self._glasses[g], self._glasses[b] = _int_as_tuple(val)
-                return
-        r, g, b = self._map_pixel(key)
-        self._glasses[r], self._glasses[g], self._glasses[b] = _int_as_tuple(value)
+                self._set_pixel(idx, val)
+        else:
+            self._set_pixel(key, value)
         if self.auto_write:
-            self.show()
+            self._auto_show()
 
     def _map_pixel(self, key):
         return self._map[key * 3 : key * 3 + 3]
 
     def fill(self, value):
         """Set all pixels to `value`."""
-        for n in range(self.n):
-            self[n] = value
+        r, g, b = _int_as_tuple(value)
+        addrs = self._map
+        buffer = self._glasses._pixel_buffer
+        if buffer:
+            # Write straight into the pixel buffer, 1 byte past the address
+            for i in range(0, len(addrs), 3):
+                buffer[addrs[i] + 1] = r
+                buffer[addrs[i + 1] + 1] = g
+                buffer[addrs[i + 2] + 1] = b
+        else:
+            for i in range(0, len(addrs), 3):
+                self._glasses[addrs[i]] = r
+                self._glasses[addrs[i + 1]] = g
+                self._glasses[addrs[i + 2]] = b
         if self.auto_write:
+            self._auto_show()
+
+    def _auto_show(self):
+        if self.auto_writer is not None:
+            self.auto_writer.mark()
+        else:
             self.show()
 
     def _range_for_slice(self, key):
-        return range(key.start or 0, key.stop or len(self), key.step or 1)
+        return range(*key.indices(self.n))
+
+    def _set_pixel(self, key, value):
+        r, g, b = self._map_pixel(key)
+        buffer = self._glasses._pixel_buffer
+        if buffer:
+            buffer[r + 1], buffer[g + 1], buffer[b + 1] = _int_as_tuple(value)
+        else:
+            self._glasses[r], self._glasses[g], self._glasses[b] = _int_as_tuple(value)
 
     def _get_pixel(self, key):
         r, g, b = self._map_pixel(key)
+        buffer = self._glasses._pixel_buffer
+        if buffer:
+            return buffer[r + 1], buffer[g + 1], buffer[b + 1]
         return self._glasses[r], self._glasses[g], self._glasses[b]
@@ -0,0 +1,253 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_is31fl3741.led_glasses_compositor`
+====================================================
+
+Layered drawing for the LED glasses. The 18x5 grid and the two rings share
+a number of physical LEDs, so drawing to both directly means whichever was
+written last wins. Here the grid and each ring draw into their own layer,
+and the layers are merged into the glasses' pixel buffer through an
+overlap table built once, with a selectable policy for the shared LEDs.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+"""
+
+import array
+
+from .pixel_map import UNUSED
+
+try:
+    # Used only for typing
+    from typing import Optional, Union
+
+    from adafruit_is31fl3741.adafruit_ledglasses import LED_Glasses
+except ImportError:
+    pass
+
+GRID_OVER = 0  # Shared LEDs show the grid where the grid pixel is lit
+RING_OVER = 1  # Shared LEDs show the ring where the ring pixel is lit
+MAX = 2  # Shared LEDs show the brighter of each channel
+ADD = 3  # Shared LEDs show the sum of each channel, clipped at 255
+
+_RING_SIZE = 24
+
+
+class CompositorLayer:
+    """
+    One layer of a `GlassesCompositor`: the grid or a ring. Colors are
+    stored as R,G,B bytes and only reach the glasses when the compositor
+    is shown.
+
+    .. py:attribute:: width
+
+       Pixels per row (24 for a ring).
+
+    .. py:attribute:: height
+
+       Rows (1 for a ring).
+    """
+
+    def __init__(self, data: memoryview, width: int, height: int):
+        self._data = data
+        self.width = width
+        self.height = height
+        self.dirty = True
+
+    def __len__(self) -> int:
+        return self.width * self.height
+
+    def __setitem__(self, index: int, color: int) -> None:
+        pos = index * 3
+        self._data[pos] = (color >> 16) & 0xFF
+        self._data[pos + 1] = (color >> 8) & 0xFF
+        self._data[pos + 2] = color & 0xFF
+        self.dirty = True
+
+    def __getitem__(self, index: int) -> int:
+        pos = index * 3
+        data = self._data
+        return (data[pos] << 16) | (data[pos + 1] << 8) | data[pos + 2]
+
+    def pixel(self, x: int, y: int, color: Optional[int] = None) -> Union[int, None]:
+        """
+        Set or retrieve RGB color of pixel at position (X,Y).
+
+        :param x:     Horizontal pixel position.
+        :param y:     Vertical pixel position.
+        :param color: If setting, RGB color value (0xRRGGBB).
+                      If getting, either None or leave off this argument.
+        :returns:     If setting, returns None. If getting, returns the
+                      pixel color as a 24-bit value.
+        """
+        if 0 <= x < self.width and 0 <= y < self.height:  # Clip
+            if color is None:
+                return self[y * self.width + x]
+            self[y * self.width + x] = color
+        return None
+
+    def fill(self, color: int = 0) -> None:
+        """Set all pixels of the layer to a given RGB color.
+
+        :param color: Packed 24-bit color value (0xRRGGBB).
+        """
+        red = (color >> 16) & 0xFF
+        green = (color >> 8) & 0xFF
+        blue = color & 0xFF
+        data = self._data
+        for pos in range(0, len(data), 3):
+            data[pos] = red
+            data[pos + 1] = green
+            data[pos + 2] = blue
+        self.dirty = True
+
+
+class GlassesCompositor:
+    """
+    Grid, left ring and right ring layers for a buffered (MUST_BUFFER or
+    PREFER_BUFFER) `adafruit_is31fl3741.adafruit_ledglasses.LED_Glasses`.
+
+    :param glasses: Target glasses.
+    :param policy:  How LEDs shared by the grid and a ring are merged:
+                    GRID_OVER, RING_OVER, MAX or ADD.
+
+    .. py:attribute:: grid
+
+       18x5 `CompositorLayer`.
+
+    .. py:attribute:: left_ring
+
+       24-pixel `CompositorLayer`, in the same order as the glasses'
+       ``left_ring``.
+
+    .. py:attribute:: right_ring
+
+       24-pixel `CompositorLayer`, in the same order as the glasses'
+       ``right_ring``.
+    """
+
+    def __init__(self, glasses: LED_Glasses, policy: int = GRID_OVER):
+        if not glasses._pixel_buffer:
+            raise ValueError("GlassesCompositor requires buffered glasses")
+        if policy not in {GRID_OVER, RING_OVER, MAX, ADD}:
+            raise ValueError("Unknown policy")
+        self._glasses = glasses
+        self.policy = policy
+        grid_size = glasses.width * glasses.height * 3
+        # All layers share one buffer so the tables can index any of them
+        self._layers = bytearray(grid_size + _RING_SIZE * 6)
+        view = memoryview(self._layers)
+        self.grid = CompositorLayer(view[:grid_size], glasses.width, glasses.height)
+        left = grid_size
+        right = grid_size + _RING_SIZE * 3
+        self.left_ring = CompositorLayer(view[left:right], _RING_SIZE, 1)
+        self.right_ring = CompositorLayer(view[right:], _RING_SIZE, 1)
+        self._build_tables(glasses, left, right)
+
+    def _build_tables(self, glasses: LED_Glasses, left: int, right: int) -> None:
+        """Sort every layer pixel into an exclusive copy table for its layer
+        or, if a grid pixel and a ring pixel light the same LED, the shared
+        table as (grid offset, ring offset, R, G, B buffer positions)."""
+        # Grid pixels by the pixel buffer positions of their R,G,B, leaving
+        # out grid pixels that share registers (the nose bridge placeholders)
+        addrs = glasses.pixel_map.addrs
+        seen = {}
+        for pixel in range(glasses.width * glasses.height):
+            if addrs[pixel * 3] != UNUSED:
+                key = addrs[pixel * 3] + 1
+                seen[key] = None if key in seen else pixel
+        grid = {}
+        for key, pixel in seen.items():
+            if pixel is not None:
+                grid[key] = (pixel * 3, (key, addrs[pixel * 3 + 1] + 1, addrs[pixel * 3 + 2] + 1))
+        shared = []
+        ring_copies = []
+        for ring, base in ((glasses.left_ring, left), (glasses.right_ring, right)):
+            copies = []
+            for led in range(_RING_SIZE):
+                raw = ring.pixel_addrs(led)
+                rgb = (raw[ring.r_offset] + 1, raw[ring.g_offset] + 1, raw[ring.b_offset] + 1)
+                offset = base + led * 3
+                if rgb[0] in grid:
+                    shared.extend((grid.pop(rgb[0])[0], offset) + rgb)
+                else:
+                    for channel in range(3):
+                        copies.extend((offset + channel, rgb[channel]))
+            ring_copies.append(array.array("H", copies))
+        copies = []
+        for offset, rgb in grid.values():
+            for channel in range(3):
+                copies.extend((offset + channel, rgb[channel]))
+        self._grid_copy = array.array("H", copies)
+        self._left_copy, self._right_copy = ring_copies
+        self._shared = array.array("H", shared)
+
+    def _copy(self, table: array.array) -> None:
+        layers = self._layers
+        buffer = self._glasses._pixel_buffer
+        for i in range(0, len(table), 2):
+            buffer[table[i + 1]] = layers[table[i]]
+
+    def _merge(self) -> None:
+        layers = self._layers
+        buffer = self._glasses._pixel_buffer
+        policy = self.policy
+        table = self._shared
+        for i in range(0, len(table), 5):
+            grid = table[i]
+            ring = table[i + 1]
+            if policy == GRID_OVER:
+                if not (layers[grid] or layers[grid + 1] or layers[grid + 2]):
+                    grid = ring
+                for channel in range(3):
+                    buffer[table[i + 2 + channel]] = layers[grid + channel]
+            elif policy == RING_OVER:
+                if layers[ring] or layers[ring + 1] or layers[ring + 2]:
+                    grid = ring
+                for channel in range(3):
+                    buffer[table[i + 2 + channel]] = layers[grid + channel]
+            elif policy == MAX:
+                for channel in range(3):
+                    buffer[table[i + 2 + channel]] = max(
+                        layers[grid + channel], layers[ring + channel]
+                    )
+            else:
+                for channel in range(3):
+                    buffer[table[i + 2 + channel]] = min(
+                        255, layers[grid + channel] + layers[ring + channel]
+                    )
+
+    def render(self, force: bool = False) -> None:
+        """Merge changed layers into the glasses' pixel buffer.
+
+        :param force: Merge every layer, changed or not (e.g. after drawing
+                      to the glasses directly, or changing `policy`).
+        """
+        grid = self.grid.dirty or force
+        left = self.left_ring.dirty or force
+        right = self.right_ring.dirty or force
+        if grid:
+            self._copy(self._grid_copy)
+        if left:
+            self._copy(self._left_copy)
+        if right:
+            self._copy(self._right_copy)
+        if grid or left or right:
+            self._merge()
+        self.grid.dirty = self.left_ring.dirty = self.right_ring.dirty = False
+
+    def show(self) -> None:
+        """Render and transmit to the glasses."""
+        self.render()
+        self._glasses.show()
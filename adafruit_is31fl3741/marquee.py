@@ -0,0 +1,163 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_is31fl3741.marquee`
+====================================================
+
+Scrolling text for IS31FL3741 RGB boards. Text is rendered once into a
+strip of column bitmasks; each step shifts the pixel buffer one column left
+through a precomputed permutation and draws only the new rightmost column
+(plus any pixels next to gaps in the board's layout), then transmits just
+the rows the marquee occupies.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+"""
+
+import array
+
+from .pixel_map import UNUSED
+
+try:
+    # Used only for typing
+    from typing import Optional
+
+    from adafruit_is31fl3741 import IS31FL3741_colorXY
+
+    from .bdf_glyphs import BDFGlyphCache
+except ImportError:
+    pass
+
+
+class Marquee:
+    """
+    Text scrolling right-to-left across a band of rows on a buffered
+    (PREFER_BUFFER or MUST_BUFFER) color display. Once the text has scrolled
+    fully off, it repeats.
+
+    :param display:    Target color display.
+    :param font:       Font to render with.
+    :param text:       String to scroll.
+    :param color:      Packed 24-bit color (0xRRGGBB) of the text.
+    :param background: Packed 24-bit color behind the text.
+    :param top:        First display row of the marquee band.
+    :param height:     Number of rows in the band; default is through to the
+                       bottom of the display. At most 32.
+    :param y:          Vertical position of the text's top (ascent) line,
+                       relative to the band; negative values crop the top of
+                       tall fonts.
+    """
+
+    def __init__(
+        self,
+        display: IS31FL3741_colorXY,
+        font: BDFGlyphCache,
+        text: str,
+        color: int,
+        background: int = 0,
+        top: int = 0,
+        height: Optional[int] = None,
+        y: int = 0,
+    ):
+        if not display._pixel_buffer:
+            raise ValueError("Marquee requires a buffered display")
+        if height is None:
+            height = display.height - top
+        if not 0 < height <= 32 or top + height > display.height:
+            raise ValueError("Marquee rows must be within display")
+        self._display = display
+        self._top = top
+        self._height = height
+        self._fg = ((color >> 16) & 0xFF, (color >> 8) & 0xFF, color & 0xFF)
+        self._bg = ((background >> 16) & 0xFF, (background >> 8) & 0xFF, background & 0xFF)
+        self._strip = self._render(font, text, y)
+        self._pos = 0
+
+        # Shift permutation: each band byte takes the value of the byte one
+        # pixel to its right. Pairs are in ascending column order, so every
+        # source is read before it is overwritten. Pixels sharing LEDs with
+        # others (e.g. the missing nose bridge pixels of the LED glasses)
+        # can't hold content, so pixels to their left are redrawn from the
+        # strip instead, as are pixels in the rightmost column.
+        addrs = display.pixel_map.addrs
+        width = display.width
+        uses = {}
+        for led in addrs:
+            uses[led] = uses.get(led, 0) + 1
+        dst = []
+        src = []
+        redraw = []
+        for x in range(width):
+            for row in range(top, top + height):
+                i = (row * width + x) * 3
+                if addrs[i] == UNUSED:
+                    continue
+                if x < width - 1 and uses[addrs[i + 3]] == 1:
+                    for channel in range(3):
+                        dst.append(addrs[i + channel] + 1)
+                        src.append(addrs[i + 3 + channel] + 1)
+                else:
+                    # Strip column distance from rightmost column, band row,
+                    # then pixel buffer positions
+                    redraw.extend(
+                        (width - 1 - x, row - top, addrs[i] + 1, addrs[i + 1] + 1, addrs[i + 2] + 1)
+                    )
+        self._dst = array.array("H", dst)
+        self._src = array.array("H", src)
+        self._redraw = array.array("H", redraw)
+
+    def _render(self, font: BDFGlyphCache, text: str, y: int) -> array.array:
+        """Render text to column bitmasks (bit n set = band row n lit), with
+        a display width of blank columns after it."""
+        strip = array.array("L", [0] * (font.text_width(text) + self._display.width))
+        x = 0
+        baseline = y + font.ascent
+        for char in text:
+            glyph = font.glyph(char)
+            if not glyph:
+                continue
+            bits, width, height, x_offset, y_offset, advance = glyph
+            stride = (width + 7) >> 3
+            for glyph_row in range(height):
+                row = baseline - y_offset - height + glyph_row
+                if 0 <= row < self._height:
+                    for col in range(width):
+                        lit = bits[glyph_row * stride + (col >> 3)] & (0x80 >> (col & 7))
+                        if lit and 0 <= x + x_offset + col < len(strip):
+                            strip[x + x_offset + col] |= 1 << row
+            x += advance
+        return strip
+
+    def step(self) -> None:
+        """Scroll one column left and transmit the marquee band."""
+        buffer = self._display._pixel_buffer
+        dst = self._dst
+        src = self._src
+        for i in range(len(dst)):
+            buffer[dst[i]] = buffer[src[i]]
+
+        strip = self._strip
+        redraw = self._redraw
+        for i in range(0, len(redraw), 5):
+            mask = strip[(self._pos - redraw[i]) % len(strip)]
+            rgb = self._fg if mask & (1 << redraw[i + 1]) else self._bg
+            buffer[redraw[i + 2]] = rgb[0]
+            buffer[redraw[i + 3]] = rgb[1]
+            buffer[redraw[i + 4]] = rgb[2]
+        self._pos = (self._pos + 1) % len(self._strip)
+
+        self._display.show_region(0, self._top, self._display.width, self._height)
+
+    def reset(self) -> None:
+        """Restart the text from the right edge of the display."""
+        self._pos = 0
@@ -0,0 +1,279 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_is31fl3741.pixel_map`
+====================================================
+
+Compiles the various board mapping styles (a ``pixel_addrs()`` function,
+packed ``ledmap_bytes``, or flat tuples such as those in
+`adafruit_is31fl3741.led_glasses_map`) into one precomputed structure that
+fast paths (fills, blits, region updates, readback) can share.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+"""
+
+import array
+from struct import unpack_from
+
+try:
+    # Used only for typing
+    from typing import Callable, Sequence, Tuple, Union
+except ImportError:
+    pass
+
+UNUSED = 65535  # Marks a missing pixel (forward) or unmapped LED (inverse)
+
+# Permutation move markers: end of a cycle, or end of a chain whose last LED
+# is set to the fill color channel (red, green, blue = 0, 1, 2) added to it
+CYCLE_END = 65535
+FILL_END = 65532
+
+# Register spans this close together are sent as one transfer
+SPAN_GAP = 4
+
+# Compiled maps, shared by every display using the same mapping
+_compiled = {}
+
+# Most region spans and permutations each PixelMap caches; when full, the
+# cache starts over, so moving regions or varying offsets can't grow it
+_CACHE_LIMIT = 16
+
+
+class PixelMap:
+    """
+    Forward and inverse lookup tables for an RGB pixel grid on an IS31FL3741.
+    Use `compile_map()` rather than constructing these directly.
+
+    :param width:  Grid width in pixels.
+    :param height: Grid height in pixels.
+    :param addrs:  array('H') of 3 LED indices per pixel, row-major, already
+                   in R,G,B order (UNUSED for missing pixels).
+
+    .. py:attribute:: addrs
+
+        Forward table: the red, green and blue LED indices of pixel (x,y) are
+        at ``addrs[(y * width + x) * 3]`` and the two elements after it.
+
+    .. py:attribute:: inverse
+
+        Inverse table of 351 elements: for each LED, ``pixel * 3 + channel``
+        (channel 0, 1, 2 = R, G, B) of the first pixel using it, or UNUSED.
+
+    .. py:attribute:: spans
+
+        Sorted (start, end) LED spans covering the whole grid, never crossing
+        the page 0/1 boundary.
+    """
+
+    def __init__(self, width: int, height: int, addrs: array.array):
+        self.width = width
+        self.height = height
+        self.addrs = addrs
+        self.inverse = array.array("H", [UNUSED] * 351)
+        for index, led in enumerate(addrs):
+            if led != UNUSED and self.inverse[led] == UNUSED:
+                self.inverse[led] = index
+        self._region_spans = {}
+        self._permutations = {}
+        self.spans = self.region_spans(0, 0, width, height)
+
+    def region_spans(self, x: int, y: int, width: int, height: int) -> Tuple:
+        """Sorted (start, end) LED spans covering a rectangle, clipped to the
+        grid. Spans separated by a gap of only a few registers are merged, as
+        a new transfer costs more than resending the bytes in between. Results
+        are cached per rectangle, for a limited number of rectangles.
+
+        :param x:      Left edge of area, in pixels.
+        :param y:      Top edge of area, in pixels.
+        :param width:  Area width in pixels.
+        :param height: Area height in pixels.
+        """
+        key = (x, y, width, height)
+        spans = self._region_spans.get(key)
+        if spans is None:
+            if len(self._region_spans) >= _CACHE_LIMIT:
+                self._region_spans.clear()
+            spans = self._region_spans[key] = merge_spans(self._leds(x, y, width, height))
+        return spans
+
+    def permutation(self, key: Tuple, source: Callable) -> array.array:
+        """In-place LED permutation moving pixel contents, as a flat array of
+        moves for `apply_permutation()`. Results are cached by key, for a
+        limited number of keys.
+
+        :param key:    Hashable key identifying the transform.
+        :param source: Function of (x, y) returning the (x, y) pixel whose
+                       content moves to x,y, or None to fill it instead.
+        """
+        moves = self._permutations.get(key)
+        if moves is None:
+            if len(self._permutations) >= _CACHE_LIMIT:
+                self._permutations.clear()
+            moves = self._permutations[key] = self._build_permutation(source)
+        return moves
+
+    def _build_permutation(self, source: Callable) -> array.array:
+        # Only pixels whose LEDs belong to them alone can hold content;
+        # missing pixels, or those sharing LEDs (e.g. the LED glasses' nose
+        # bridge), are neither moved nor moved into, and read as fill.
+        uses = {}
+        for led in self.addrs:
+            uses[led] = uses.get(led, 0) + 1
+        width = self.width
+        move_from = {}  # Destination LED -> source LED, or FILL_END + channel
+        for y in range(self.height):
+            for x in range(width):
+                dst = (y * width + x) * 3
+                if uses[self.addrs[dst]] != 1:
+                    continue
+                pos = source(x, y)
+                src = None if pos is None else (pos[1] * width + pos[0]) * 3
+                if src is not None and uses[self.addrs[src]] != 1:
+                    src = None
+                for channel in range(3):
+                    if src is None:
+                        move_from[self.addrs[dst + channel]] = FILL_END + channel
+                    elif src != dst:
+                        move_from[self.addrs[dst + channel]] = self.addrs[src + channel]
+
+        moves = array.array("H")
+        # Chains ending in a fill, started from LEDs no other LED needs the
+        # old value of, then the remaining closed cycles
+        sources = set(move_from.values())
+        for head in list(move_from):
+            if head not in sources:
+                led = head
+                while led < FILL_END:
+                    moves.append(led)
+                    led = move_from.pop(led)
+                moves.append(led)
+        while move_from:
+            head = led = next(iter(move_from))
+            while led in move_from:
+                moves.append(led)
+                led = move_from.pop(led)
+            moves.append(CYCLE_END)
+        return moves
+
+    def _leds(self, x: int, y: int, width: int, height: int) -> set:
+        leds = set()
+        addrs = self.addrs
+        for row in range(max(y, 0), min(y + height, self.height)):
+            start = (row * self.width + max(x, 0)) * 3
+            end = (row * self.width + min(x + width, self.width)) * 3
+            leds.update(addrs[start:end])
+        leds.discard(UNUSED)
+        return leds
+
+
+def apply_permutation(target, moves: array.array, fill: Tuple[int, int, int]) -> None:
+    """Apply permutation moves from `PixelMap.permutation()` in place.
+
+    :param target: LED-indexed values, e.g. the pixel buffer past its first
+                   byte, or an IS31FL3741 itself when unbuffered.
+    :param moves:  Permutation moves.
+    :param fill:   Red, green and blue values for vacated pixels.
+    """
+    count = len(moves)
+    i = 0
+    while i < count:
+        saved = target[moves[i]]
+        while True:
+            dst = moves[i]
+            src = moves[i + 1]
+            if src < FILL_END:
+                target[dst] = target[src]
+                i += 1
+            else:
+                target[dst] = saved if src == CYCLE_END else fill[src - FILL_END]
+                i += 2
+                break
+
+
+def merge_spans(leds: set) -> Tuple:
+    """Sorted (start, end) spans covering a set of LED indices, with spans
+    at most SPAN_GAP registers apart merged and none crossing the page 0/1
+    boundary, for writing with as few transfers as possible.
+
+    :param leds: LED indices, 0 to 350.
+    """
+    spans = []
+    for led in sorted(leds):
+        if spans and led - spans[-1][1] <= SPAN_GAP and (led < 180) == (spans[-1][0] < 180):
+            spans[-1][1] = led + 1
+        else:
+            spans.append([led, led + 1])
+    return tuple((start, end) for start, end in spans)
+
+
+def compile_map(
+    source: Union[Callable, bytes, Sequence[int]],
+    width: int,
+    height: int,
+    order: int,
+    column_major: bool = False,
+) -> PixelMap:
+    """Compile a board mapping into a `PixelMap`. Maps from plain functions
+    (e.g. a ``pixel_addrs`` staticmethod) and bytes or tuples are cached, so
+    boards sharing a mapping share one set of tables. Maps from bound methods
+    aren't, as the cache would keep their instances alive.
+
+    :param source: Either a ``pixel_addrs(x, y)`` function returning 3 LED
+                   indices, bytes of packed big-endian 16-bit LED index
+                   triples (like ``ledmap_bytes``), or a flat sequence of
+                   LED index triples (like the tuples in ``led_glasses_map``).
+                   Triples are in device order; any element of 65535 marks
+                   the pixel as missing.
+    :param width:  Grid width in pixels.
+    :param height: Grid height in pixels.
+    :param order:  Pixel RGB color order, one of the IS3741_* color types.
+    :param column_major: True if a bytes or sequence source lists pixels
+                   column by column (as the LED glasses maps do) rather than
+                   row by row. Ignored for functions.
+    """
+    key = None
+    if not callable(source) or type(source) is type(compile_map):
+        try:
+            key = (source, width, height, order, column_major)
+            return _compiled[key]
+        except KeyError:
+            pass
+        except TypeError:  # Unhashable source (e.g. a list), don't cache
+            key = None
+
+    r_offset = (order >> 4) & 3
+    g_offset = (order >> 2) & 3
+    b_offset = order & 3
+    addrs = array.array("H", [UNUSED] * (width * height * 3))
+    index = 0
+    for y in range(height):
+        for x in range(width):
+            if callable(source):
+                leds = source(x, y)
+            else:
+                pos = x * height + y if column_major else y * width + x
+                if isinstance(source, (bytes, bytearray)):
+                    leds = unpack_from(">HHH", source, pos * 6)
+                else:
+                    leds = source[pos * 3 : pos * 3 + 3]
+            if UNUSED not in leds:
+                addrs[index] = leds[r_offset]
+                addrs[index + 1] = leds[g_offset]
+                addrs[index + 2] = leds[b_offset]
+            index += 3
+
+    pixel_map = PixelMap(width, height, addrs)
+    if key is not None:
+        _compiled[key] = pixel_map
+    return pixel_map
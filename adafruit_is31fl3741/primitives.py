@@ -0,0 +1,241 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_is31fl3741.primitives`
+====================================================
+
+Drawing primitives for IS31FL3741 RGB boards: lines, rectangles, circles
+and gradients. Each primitive clips once up front, then writes runs of
+pixels through the display's precomputed pixel map rather than calling
+``pixel()`` for every point.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+"""
+
+try:
+    # Used only for typing
+    from adafruit_is31fl3741 import IS31FL3741_colorXY
+except ImportError:
+    pass
+
+
+def hline(display: IS31FL3741_colorXY, x: int, y: int, length: int, color: int) -> None:
+    """Draw a horizontal line.
+
+    :param display: Target color display.
+    :param x:       Horizontal position of left end.
+    :param y:       Vertical position.
+    :param length:  Length in pixels.
+    :param color:   Packed 24-bit color (0xRRGGBB).
+    """
+    if 0 <= y < display.height:
+        start = max(x, 0)
+        end = min(x + length, display.width)
+        if start < end:
+            display.fill_pixels(y * display.width + start, end - start, 1, color)
+
+
+def vline(display: IS31FL3741_colorXY, x: int, y: int, length: int, color: int) -> None:
+    """Draw a vertical line.
+
+    :param display: Target color display.
+    :param x:       Horizontal position.
+    :param y:       Vertical position of top end.
+    :param length:  Length in pixels.
+    :param color:   Packed 24-bit color (0xRRGGBB).
+    """
+    if 0 <= x < display.width:
+        start = max(y, 0)
+        end = min(y + length, display.height)
+        if start < end:
+            display.fill_pixels(start * display.width + x, end - start, display.width, color)
+
+
+def fill_rect(
+    display: IS31FL3741_colorXY, x: int, y: int, width: int, height: int, color: int
+) -> None:
+    """Draw a filled rectangle.
+
+    :param display: Target color display.
+    :param x:       Horizontal position of left edge.
+    :param y:       Vertical position of top edge.
+    :param width:   Width in pixels.
+    :param height:  Height in pixels.
+    :param color:   Packed 24-bit color (0xRRGGBB).
+    """
+    start = max(x, 0)
+    end = min(x + width, display.width)
+    if start < end:
+        for row in range(max(y, 0), min(y + height, display.height)):
+            display.fill_pixels(row * display.width + start, end - start, 1, color)
+
+
+def rect(display: IS31FL3741_colorXY, x: int, y: int, width: int, height: int, color: int) -> None:
+    """Draw a rectangle outline.
+
+    :param display: Target color display.
+    :param x:       Horizontal position of left edge.
+    :param y:       Vertical position of top edge.
+    :param width:   Width in pixels.
+    :param height:  Height in pixels.
+    :param color:   Packed 24-bit color (0xRRGGBB).
+    """
+    if width > 0 and height > 0:
+        hline(display, x, y, width, color)
+        hline(display, x, y + height - 1, width, color)
+        vline(display, x, y + 1, height - 2, color)
+        vline(display, x + width - 1, y + 1, height - 2, color)
+
+
+def line(display: IS31FL3741_colorXY, x0: int, y0: int, x1: int, y1: int, color: int) -> None:
+    """Draw a line between two points (Bresenham's algorithm). Horizontal and
+    vertical lines are passed to `hline()` and `vline()`.
+
+    :param display: Target color display.
+    :param x0:      Horizontal position of first point.
+    :param y0:      Vertical position of first point.
+    :param x1:      Horizontal position of second point.
+    :param y1:      Vertical position of second point.
+    :param color:   Packed 24-bit color (0xRRGGBB).
+    """
+    if y0 == y1:
+        hline(display, min(x0, x1), y0, abs(x1 - x0) + 1, color)
+        return
+    if x0 == x1:
+        vline(display, x0, min(y0, y1), abs(y1 - y0) + 1, color)
+        return
+    width = display.width
+    height = display.height
+    # A line is within the display if both ends are, then no per-point clip
+    inside = 0 <= min(x0, x1) and max(x0, x1) < width and 0 <= min(y0, y1) and max(y0, y1) < height
+    dx = abs(x1 - x0)
+    dy = -abs(y1 - y0)
+    sx = 1 if x0 < x1 else -1
+    sy = 1 if y0 < y1 else -1
+    err = dx + dy
+    while True:
+        if inside or (0 <= x0 < width and 0 <= y0 < height):
+            display.fill_pixels(y0 * width + x0, 1, 1, color)
+        if x0 == x1 and y0 == y1:
+            break
+        err2 = 2 * err
+        if err2 >= dy:
+            err += dy
+            x0 += sx
+        if err2 <= dx:
+            err += dx
+            y0 += sy
+
+
+def circle(display: IS31FL3741_colorXY, x: int, y: int, radius: int, color: int) -> None:
+    """Draw a circle outline (midpoint algorithm).
+
+    :param display: Target color display.
+    :param x:       Horizontal position of center.
+    :param y:       Vertical position of center.
+    :param radius:  Radius in pixels.
+    :param color:   Packed 24-bit color (0xRRGGBB).
+    """
+    width = display.width
+    height = display.height
+    inside = radius <= x < width - radius and radius <= y < height - radius
+    dx = radius
+    dy = 0
+    err = 1 - radius
+    while dx >= dy:
+        for px, py in (
+            (x + dx, y + dy),
+            (x - dx, y + dy),
+            (x + dx, y - dy),
+            (x - dx, y - dy),
+            (x + dy, y + dx),
+            (x - dy, y + dx),
+            (x + dy, y - dx),
+            (x - dy, y - dx),
+        ):
+            if inside or (0 <= px < width and 0 <= py < height):
+                display.fill_pixels(py * width + px, 1, 1, color)
+        dy += 1
+        if err < 0:
+            err += 2 * dy + 1
+        else:
+            dx -= 1
+            err += 2 * (dy - dx) + 1
+
+
+def fill_circle(display: IS31FL3741_colorXY, x: int, y: int, radius: int, color: int) -> None:
+    """Draw a filled circle, as one horizontal run per row.
+
+    :param display: Target color display.
+    :param x:       Horizontal position of center.
+    :param y:       Vertical position of center.
+    :param radius:  Radius in pixels.
+    :param color:   Packed 24-bit color (0xRRGGBB).
+    """
+    dx = radius
+    dy = 0
+    err = 1 - radius
+    while dx >= dy:
+        hline(display, x - dx, y + dy, 2 * dx + 1, color)
+        hline(display, x - dx, y - dy, 2 * dx + 1, color)
+        hline(display, x - dy, y + dx, 2 * dy + 1, color)
+        hline(display, x - dy, y - dx, 2 * dy + 1, color)
+        dy += 1
+        if err < 0:
+            err += 2 * dy + 1
+        else:
+            dx -= 1
+            err += 2 * (dy - dx) + 1
+
+
+def _blend(color0: int, color1: int, pos: int, steps: int) -> int:
+    """Integer interpolation between packed colors, pos of steps."""
+    if steps <= 0:
+        return color0
+    result = 0
+    for shift in (16, 8, 0):
+        c0 = (color0 >> shift) & 0xFF
+        c1 = (color1 >> shift) & 0xFF
+        result |= (c0 + (c1 - c0) * pos // steps) << shift
+    return result
+
+
+def gradient(
+    display: IS31FL3741_colorXY,
+    x: int,
+    y: int,
+    width: int,
+    height: int,
+    color0: int,
+    color1: int,
+    vertical: bool = False,
+) -> None:
+    """Fill a rectangle with a linear gradient. Each color is calculated
+    once per column (or row) and drawn as a line.
+
+    :param display:  Target color display.
+    :param x:        Horizontal position of left edge.
+    :param y:        Vertical position of top edge.
+    :param width:    Width in pixels.
+    :param height:   Height in pixels.
+    :param color0:   Packed 24-bit color (0xRRGGBB) at left (or top) edge.
+    :param color1:   Packed 24-bit color at right (or bottom) edge.
+    :param vertical: True for top-to-bottom, False for left-to-right.
+    """
+    if vertical:
+        for row in range(max(y, 0), min(y + height, display.height)):
+            hline(display, x, row, width, _blend(color0, color1, row - y, height - 1))
+    else:
+        for col in range(max(x, 0), min(x + width, display.width)):
+            vline(display, col, y, height, _blend(color0, color1, col - x, width - 1))
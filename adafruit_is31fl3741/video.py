@@ -0,0 +1,204 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_is31fl3741.video`
+====================================================
+
+Stream raw RGB888 video (e.g. ``ffmpeg -f rawvideo -pix_fmt rgb24`` output)
+to an IS31FL3741 RGB board from a pipe or file, on Linux/CPython. Frames
+are sampled down to the board through a table computed once, scattered into
+the pixel buffer and sent at a paced frame rate, dropping frames when the
+bus can't keep up.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Linux/CPython with Adafruit Blinka. Regular files are memory-mapped.
+
+"""
+
+import array
+import mmap
+import time
+
+from .frame_pacer import FramePacer
+from .pixel_map import UNUSED
+
+try:
+    # Used only for typing
+    from typing import BinaryIO, Optional
+
+    from adafruit_is31fl3741 import IS31FL3741_colorXY
+except ImportError:
+    pass
+
+STRETCH = 0  # Scale each axis independently to fill the board
+CROP = 1  # Scale to fill the board keeping aspect ratio, crop the excess
+
+
+class VideoStreamer:
+    """
+    Plays fixed-size raw RGB888 frames on a buffered color display.
+
+    :param display: Target color display (PREFER_BUFFER or MUST_BUFFER).
+    :param source:  Binary stream (e.g. ``sys.stdin.buffer``) or file of
+                    concatenated frames. Seekable files are memory-mapped.
+    :param width:   Source frame width in pixels.
+    :param height:  Source frame height in pixels.
+    :param fps:     Target frames per second; also the rate frames are
+                    assumed to arrive at when deciding what to drop.
+    :param scaling: STRETCH or CROP.
+
+    .. py:attribute:: pacer
+
+        The `adafruit_is31fl3741.frame_pacer.FramePacer` timing `step()`,
+        holding its frame rate and timing statistics.
+    """
+
+    def __init__(
+        self,
+        display: IS31FL3741_colorXY,
+        source: BinaryIO,
+        width: int,
+        height: int,
+        fps: float = 30,
+        scaling: int = CROP,
+    ):
+        if not display._pixel_buffer:
+            raise ValueError("VideoStreamer requires a buffered display")
+        self._display = display
+        self._source = source
+        self.frame_size = width * height * 3
+        self.pacer = FramePacer(self, fps)
+        self._map = None
+        try:
+            if source.seekable():
+                self._map = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+        except (AttributeError, OSError, ValueError):
+            pass
+        if self._map is None:
+            self._frame = bytearray(self.frame_size)
+        self._offset = 0
+        self._sample(width, height, scaling)
+        self.frames_shown = 0
+        self.frames_dropped = 0
+        self._start = None
+        self._ended = False
+
+    @property
+    def fps(self) -> float:
+        """Target frames per second."""
+        return self.pacer.fps
+
+    @fps.setter
+    def fps(self, value: float) -> None:
+        self.pacer.fps = value
+
+    def _sample(self, width: int, height: int, scaling: int) -> None:
+        """Build the sampling table: for each board pixel, the source byte
+        offset of the frame pixel nearest its center, plus its R,G,B
+        positions in the pixel buffer."""
+        board_w = self._display.width
+        board_h = self._display.height
+        scale_x = width / board_w
+        scale_y = height / board_h
+        left = top = 0.0
+        if scaling == CROP:
+            scale_x = scale_y = min(scale_x, scale_y)
+            left = (width - board_w * scale_x) / 2
+            top = (height - board_h * scale_y) / 2
+        addrs = self._display.pixel_map.addrs
+        src = []
+        dst = []
+        for y in range(board_h):
+            sy = min(int(top + (y + 0.5) * scale_y), height - 1)
+            for x in range(board_w):
+                i = (y * board_w + x) * 3
+                if addrs[i] != UNUSED:
+                    sx = min(int(left + (x + 0.5) * scale_x), width - 1)
+                    src.append((sy * width + sx) * 3)
+                    dst.extend((addrs[i] + 1, addrs[i + 1] + 1, addrs[i + 2] + 1))
+        self._src = array.array("L", src)
+        self._dst = array.array("H", dst)
+
+    def _next_frame(self, skip: int = 0):
+        """Frame data after skipping some frames, or None at end of
+        stream."""
+        if self._map is not None:
+            self._offset += skip * self.frame_size
+            if self._offset + self.frame_size > len(self._map):
+                return None
+            frame = memoryview(self._map)[self._offset : self._offset + self.frame_size]
+            self._offset += self.frame_size
+            return frame
+        for _ in range(skip + 1):
+            view = memoryview(self._frame)
+            while view:
+                count = self._source.readinto(view)
+                if not count:
+                    return None
+                view = view[count:]
+        return self._frame
+
+    def _scatter(self, frame) -> None:
+        buffer = self._display._pixel_buffer
+        src = self._src
+        dst = self._dst
+        for i in range(len(src)):
+            s = src[i]
+            d = i * 3
+            buffer[dst[d]] = frame[s]
+            buffer[dst[d + 1]] = frame[s + 1]
+            buffer[dst[d + 2]] = frame[s + 2]
+
+    def show(self) -> None:
+        """Show the frame `pacer` is due to show, first dropping any source
+        frames it skipped to keep up. Called by the pacer from `step()`."""
+        if self._start is None:
+            self._start = time.monotonic()
+        consumed = self.frames_shown + self.frames_dropped
+        skip = max(0, self.pacer.frame_number - consumed)
+        frame = self._next_frame(skip)
+        if frame is None:
+            self._ended = True
+            return
+        self.frames_dropped += skip
+        self._scatter(frame)
+        self._display.show()
+        self.frames_shown += 1
+
+    def step(self) -> bool:
+        """Show the next due frame, dropping any the display has fallen
+        behind on, then wait until the following frame is due.
+
+        :returns: False at end of stream, else True.
+        """
+        if not self._ended:
+            self.pacer.frame()
+        return not self._ended
+
+    def run(self, max_frames: Optional[int] = None) -> None:
+        """Stream until the source ends (or max_frames have been shown)."""
+        while max_frames is None or self.frames_shown < max_frames:
+            if not self.step():
+                break
+
+    @property
+    def achieved_fps(self) -> float:
+        """Frames actually shown per second since streaming started."""
+        if self._start is None:
+            return 0.0
+        elapsed = time.monotonic() - self._start
+        return self.frames_shown / elapsed if elapsed > 0 else 0.0
+
+    def close(self) -> None:
+        """Release the memory map, if any. Does not close the source."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
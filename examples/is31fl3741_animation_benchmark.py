@@ -0,0 +1,48 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Count transmissions and time per fill() / slice write of the LED
+# Animation compatibility layer
+
+import time
+
+import board
+
+from adafruit_is31fl3741.adafruit_ledglasses import MUST_BUFFER, LED_Glasses
+from adafruit_is31fl3741.led_glasses_animation import LED_Glasses_Animation
+
+i2c = board.I2C()  # uses board.SCL and board.SDA
+# i2c = board.STEMMA_I2C()  # For using the built-in STEMMA QT connector on a microcontroller
+glasses = LED_Glasses(i2c, allocate=MUST_BUFFER)
+
+transmissions = [0]
+glasses_show = glasses.show
+
+
+def counted_show():
+    transmissions[0] += 1
+    glasses_show()
+
+
+glasses.show = counted_show
+pixels = LED_Glasses_Animation(glasses)
+
+ITERATIONS = 20
+
+
+def bench(name, func, *args):
+    transmissions[0] = 0
+    start = time.monotonic()
+    for _ in range(ITERATIONS):
+        func(*args)
+    elapsed = (time.monotonic() - start) / ITERATIONS
+    print(f"{name}: {transmissions[0] / ITERATIONS:.0f} transmissions, {elapsed * 1000:.2f} ms")
+
+
+def slice_write(color):
+    pixels[0 : len(pixels)] = [color] * len(pixels)
+
+
+bench("fill()", pixels.fill, 0x100010)
+bench("slice write", slice_write, 0x001010)
+bench("slice read", lambda: pixels[:])
@@ -0,0 +1,39 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Fade the RGB Matrix QT through its dimmest levels with 2 extra bits of
+# depth from temporal dithering, refreshed by an asyncio task
+
+import asyncio
+
+import board
+
+import adafruit_is31fl3741
+from adafruit_is31fl3741.adafruit_rgbmatrixqt import Adafruit_RGBMatrixQT
+from adafruit_is31fl3741.dither import TemporalDither
+
+i2c = board.I2C()  # uses board.SCL and board.SDA
+# i2c = board.STEMMA_I2C()  # For using the built-in STEMMA QT connector on a microcontroller
+is31 = Adafruit_RGBMatrixQT(i2c, allocate=adafruit_is31fl3741.MUST_BUFFER)
+is31.set_led_scaling(0xFF)
+is31.global_current = 0x10
+is31.enable = True
+
+SUBFRAMES = 4
+REFRESH = 60 * SUBFRAMES  # Sub-frames per second
+dither = TemporalDither(is31, subframes=SUBFRAMES)
+
+
+async def fade():
+    while True:
+        for level in range(16 * SUBFRAMES):  # 1/4 steps up to PWM 16
+            dither.fill(level)
+            print(f"level {level / SUBFRAMES:.2f}: ~{dither.bus_load(REFRESH):.0f} bytes/s")
+            await asyncio.sleep(0.1)
+
+
+async def main():
+    await asyncio.gather(dither.run_async(REFRESH), fade())
+
+
+asyncio.run(main())
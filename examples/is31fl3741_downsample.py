@@ -0,0 +1,39 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Draw a smooth moving ball on the LED glasses by rendering at 3x the
+# resolution and box-filtering down to 18x5.
+
+import board
+
+import adafruit_is31fl3741
+from adafruit_is31fl3741.adafruit_ledglasses import LED_Glasses
+from adafruit_is31fl3741.downsample import Downsampler
+
+i2c = board.I2C()  # uses board.SCL and board.SDA
+glasses = LED_Glasses(i2c, allocate=adafruit_is31fl3741.MUST_BUFFER)
+glasses.set_led_scaling(0xFF)
+glasses.global_current = 0xFE
+glasses.enable = True
+
+SCALE = 3
+RADIUS = 5  # In canvas pixels
+downsampler = Downsampler(glasses, SCALE)
+canvas = bytearray(downsampler.width * downsampler.height * 3)
+cy = downsampler.height // 2
+
+cx = RADIUS
+dx = 1
+while True:
+    canvas[:] = bytes(len(canvas))
+    for y in range(max(0, cy - RADIUS), min(downsampler.height, cy + RADIUS + 1)):
+        for x in range(max(0, cx - RADIUS), min(downsampler.width, cx + RADIUS + 1)):
+            if (x - cx) ** 2 + (y - cy) ** 2 <= RADIUS * RADIUS:
+                pos = (y * downsampler.width + x) * 3
+                canvas[pos] = 0x40
+                canvas[pos + 2] = 0xFF
+    downsampler.render(canvas)
+    glasses.show()
+    cx += dx
+    if cx in {RADIUS, downsampler.width - 1 - RADIUS}:
+        dx = -dx
@@ -0,0 +1,36 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Sweep a column across the RGB Matrix QT at a steady 30 frames per second,
+# printing whether rendering or the I2C bus takes up the frame time
+
+import board
+
+import adafruit_is31fl3741
+from adafruit_is31fl3741 import primitives
+from adafruit_is31fl3741.adafruit_rgbmatrixqt import Adafruit_RGBMatrixQT
+from adafruit_is31fl3741.frame_pacer import FramePacer
+
+i2c = board.I2C()  # uses board.SCL and board.SDA
+# i2c = board.STEMMA_I2C()  # For using the built-in STEMMA QT connector on a microcontroller
+is31 = Adafruit_RGBMatrixQT(i2c, allocate=adafruit_is31fl3741.MUST_BUFFER)
+is31.set_led_scaling(0xFF)
+is31.global_current = 0x10
+is31.enable = True
+
+pacer = FramePacer(is31, fps=30)
+
+
+def render():
+    # Derive position from the frame number, so skipped frames keep time
+    column = pacer.frame_number % is31.width
+    is31.fill(0)
+    primitives.vline(is31, column, 0, is31.height, 0x002040)
+
+
+while True:
+    pacer.run(render, frames=90)
+    print(
+        f"{pacer.achieved_fps:.1f} fps, render {pacer.render_time * 1000:.1f} ms, "
+        f"show {pacer.transmit_time * 1000:.1f} ms, dropped {pacer.frames_dropped}"
+    )
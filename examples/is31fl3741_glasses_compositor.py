@@ -0,0 +1,28 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Spin the rings and sweep a bar across the grid as separate layers; where
+# they share LEDs, the brighter channel wins
+
+import board
+
+from adafruit_is31fl3741.adafruit_ledglasses import MUST_BUFFER, LED_Glasses
+from adafruit_is31fl3741.led_glasses_compositor import MAX, GlassesCompositor
+
+i2c = board.I2C()  # uses board.SCL and board.SDA
+# i2c = board.STEMMA_I2C()  # For using the built-in STEMMA QT connector on a microcontroller
+glasses = LED_Glasses(i2c, allocate=MUST_BUFFER)
+
+compositor = GlassesCompositor(glasses, policy=MAX)
+
+frame = 0
+while True:
+    compositor.left_ring.fill(0)
+    compositor.right_ring.fill(0)
+    compositor.left_ring[frame % 24] = 0x400000
+    compositor.right_ring[23 - frame % 24] = 0x400000
+    compositor.grid.fill(0)
+    for y in range(compositor.grid.height):
+        compositor.grid.pixel(frame % compositor.grid.width, y, 0x000040)
+    compositor.show()
+    frame += 1
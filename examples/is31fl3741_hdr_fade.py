@@ -0,0 +1,30 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Slow, smooth fade up from nearly off on the RGB Matrix QT, using 16-bit
+# channel values split across PWM and per-LED scaling
+
+import time
+
+import board
+
+import adafruit_is31fl3741
+from adafruit_is31fl3741.adafruit_rgbmatrixqt import Adafruit_RGBMatrixQT
+from adafruit_is31fl3741.hdr import HDRSurface
+
+i2c = board.I2C()  # uses board.SCL and board.SDA
+# i2c = board.STEMMA_I2C()  # For using the built-in STEMMA QT connector on a microcontroller
+is31 = Adafruit_RGBMatrixQT(i2c, allocate=adafruit_is31fl3741.MUST_BUFFER)
+is31.global_current = 0x20
+is31.enable = True
+
+surface = HDRSurface(is31, bits=16)
+
+while True:
+    # Quadratic ramp: most of the time is spent at the dim end, where plain
+    # 8-bit PWM would only have a handful of steps
+    for step in range(256):
+        level = step * step
+        surface.fill((level, level // 2, level // 4))
+        surface.show()
+        time.sleep(0.02)
@@ -0,0 +1,23 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+import time
+
+import board
+
+from adafruit_is31fl3741.adafruit_ledglasses import MUST_BUFFER, LED_Glasses
+from adafruit_is31fl3741.bdf_glyphs import BDFGlyphCache
+from adafruit_is31fl3741.marquee import Marquee
+
+i2c = board.I2C()  # uses board.SCL and board.SDA
+# i2c = board.STEMMA_I2C()  # For using the built-in STEMMA QT connector on a microcontroller
+glasses = LED_Glasses(i2c, allocate=MUST_BUFFER)
+glasses.global_current = 20
+
+# Font is 15 pixels tall; y=-8 shows its bottom rows on the 5-row grid
+font = BDFGlyphCache("scrolly.bdf")
+marquee = Marquee(glasses, font, "HELLO FROM CIRCUITPYTHON", 0xFFD200, y=-8)
+
+while True:
+    marquee.step()
+    time.sleep(0.03)
@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Compare drawing primitives against the equivalent per-pixel loops
+
+import time
+
+import board
+
+import adafruit_is31fl3741
+from adafruit_is31fl3741 import primitives
+from adafruit_is31fl3741.adafruit_rgbmatrixqt import Adafruit_RGBMatrixQT
+
+i2c = board.I2C()  # uses board.SCL and board.SDA
+# i2c = board.STEMMA_I2C()  # For using the built-in STEMMA QT connector on a microcontroller
+is31 = Adafruit_RGBMatrixQT(i2c, allocate=adafruit_is31fl3741.MUST_BUFFER)
+is31.set_led_scaling(0xFF)
+is31.global_current = 0x10
+is31.enable = True
+
+ITERATIONS = 20
+
+
+def naive_rect(x, y, width, height, color):
+    for row in range(y, y + height):
+        for col in range(x, x + width):
+            is31.pixel(col, row, color)
+
+
+def naive_lines(color):
+    for row in range(is31.height):
+        is31.pixel(6, row, color)
+    for col in range(is31.width):
+        is31.pixel(col, 4, color)
+
+
+def prim_lines(color):
+    primitives.vline(is31, 6, 0, is31.height, color)
+    primitives.hline(is31, 0, 4, is31.width, color)
+
+
+def bench(name, func, *args):
+    start = time.monotonic()
+    for _ in range(ITERATIONS):
+        func(*args)
+    elapsed = (time.monotonic() - start) / ITERATIONS
+    print(f"{name}: {elapsed * 1000:.2f} ms")
+    return elapsed
+
+
+naive = bench("pixel() rectangle", naive_rect, 0, 0, 13, 9, 0x200000)
+fast = bench("fill_rect()", primitives.fill_rect, is31, 0, 0, 13, 9, 0x002000)
+print(f"  speedup {naive / fast:.1f}x")
+naive = bench("pixel() lines", naive_lines, 0x000020)
+fast = bench("hline()/vline()", prim_lines, 0x202000)
+print(f"  speedup {naive / fast:.1f}x")
+bench("circle()", primitives.circle, is31, 6, 4, 4, 0x002020)
+bench("gradient()", primitives.gradient, is31, 0, 0, 13, 9, 0x200000, 0x000020)
+is31.show()
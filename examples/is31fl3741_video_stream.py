@@ -0,0 +1,29 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Stream video to the RGB Matrix QT from a Linux computer, e.g.:
+#   ffmpeg -re -i video.mp4 -f rawvideo -pix_fmt rgb24 -s 52x36 - | \
+#       python3 is31fl3741_video_stream.py 52 36
+
+import sys
+
+import board
+
+import adafruit_is31fl3741
+from adafruit_is31fl3741.adafruit_rgbmatrixqt import Adafruit_RGBMatrixQT
+from adafruit_is31fl3741.video import CROP, VideoStreamer
+
+i2c = board.I2C()  # uses board.SCL and board.SDA
+is31 = Adafruit_RGBMatrixQT(i2c, allocate=adafruit_is31fl3741.MUST_BUFFER)
+is31.set_led_scaling(0xFF)
+is31.global_current = 0x20
+is31.enable = True
+
+streamer = VideoStreamer(
+    is31, sys.stdin.buffer, int(sys.argv[1]), int(sys.argv[2]), fps=30, scaling=CROP
+)
+streamer.run()
+print(
+    f"Shown {streamer.frames_shown}, dropped {streamer.frames_dropped}, "
+    f"{streamer.achieved_fps:.1f} fps"
+)